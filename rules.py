@@ -3,17 +3,30 @@ from __future__ import annotations
 
 import json
 import math
-from dataclasses import asdict, dataclass
-from typing import Any, Mapping, MutableMapping
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Callable, Mapping, MutableMapping
+
+
+def _get_value_mapping(obj: Any, key: str, default: Any = None) -> Any:
+    """Retrieve *key* from a mapping with a fallback."""
+    return obj.get(key, default)
+
+
+def _get_value_attr(obj: Any, key: str, default: Any = None) -> Any:
+    """Retrieve the attribute *key* from an object with a fallback."""
+    return getattr(obj, key, default)
+
+
+@lru_cache(maxsize=None)
+def _getter_for(kind: type) -> Callable[..., Any]:
+    """Return the value accessor suited to instances of *kind*."""
+    return _get_value_mapping if issubclass(kind, Mapping) else _get_value_attr
 
 
 def _get_value(obj: Any, key: str, default: Any = None) -> Any:
     """Retrieve *key* from mappings or objects with a fallback."""
-    if isinstance(obj, Mapping):
-        return obj.get(key, default)
-    if hasattr(obj, key):
-        return getattr(obj, key)
-    return default
+    return _getter_for(type(obj))(obj, key, default)
 
 
 PASS_LIMITS = {
@@ -107,7 +120,7 @@ def _normalise_pass_limit(value: Any) -> int | None:
     raise TypeError(f"Unsupported pass limit type: {type(value).__name__}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuleProfile:
     """A configurable rules profile for the solitaire engine."""
 
@@ -119,31 +132,98 @@ class RuleProfile:
     autoplay_safe_only: bool
     undo_unlimited: bool
 
+    # Derived state populated by ``__post_init__``; excluded from the
+    # constructor, comparisons and serialisation.
+    _pass_limit: int | None = field(default=None, init=False, repr=False, compare=False)
+    _pass_limit_ok: bool = field(default=False, init=False, repr=False, compare=False)
+    _allowed_strength: int = field(default=0, init=False, repr=False, compare=False)
+    _as_dict: dict = field(default=None, init=False, repr=False, compare=False)  # type: ignore[assignment]
+    _as_json: str | None = field(default=None, init=False, repr=False, compare=False)
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+    _checker: Callable[[Any, Any], bool] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Profiles are immutable, so the normalised tokens consulted by
+        # ``is_move_legal`` are resolved once here rather than on every call.
+        # Invalid pass limits are left unresolved so that the error surfaces
+        # when ``pass_limit`` is read, exactly as before.
+        try:
+            pass_limit = _normalise_pass_limit(self.passes)
+        except (TypeError, ValueError):
+            pass_limit_ok = False
+            pass_limit = None
+        else:
+            pass_limit_ok = True
+        supermove = self.supermove.lower() if isinstance(self.supermove, str) else ""
+        object.__setattr__(self, "_pass_limit", pass_limit)
+        object.__setattr__(self, "_pass_limit_ok", pass_limit_ok)
+        object.__setattr__(
+            self, "_allowed_strength", SUPERMOVE_STRENGTH.get(supermove, 0)
+        )
+        # The serialised forms never change either; the mapping is built here
+        # and the JSON payload on first use.  Every field is an immutable
+        # scalar, so ``asdict``'s recursive copy is unnecessary.
+        object.__setattr__(
+            self, "_as_dict", {name: getattr(self, name) for name in _PROFILE_FIELD_NAMES}
+        )
+
+    def __hash__(self) -> int:
+        cached = self._hash
+        if cached is None:
+            cached = hash(tuple(self._as_dict.values()))
+            object.__setattr__(self, "_hash", cached)
+        return cached
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through ``__init__`` so the cached hash, which depends on
+        # the per-process string hash seed, is never carried across pickles.
+        return (type(self), tuple(self._as_dict.values()))
+
     def to_dict(self) -> MutableMapping[str, Any]:
         """Return the profile as a JSON-serialisable mapping."""
-        return dict(asdict(self))
+        return dict(self._as_dict)
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "RuleProfile":
-        """Create a profile from *data* produced by :meth:`to_dict`."""
-        fields = {field.name for field in cls.__dataclass_fields__.values()}
-        filtered = {k: data[k] for k in data if k in fields}
-        return cls(**filtered)  # type: ignore[arg-type]
+        """Create a profile from *data* produced by :meth:`to_dict`.
+
+        Profiles are immutable, so identical inputs share one cached instance.
+        Values are keyed together with their types so that, for example,
+        ``passes=3`` and ``passes=3.0`` still produce distinct profiles.
+        """
+        key = tuple(
+            (name, type(data[name]), data[name])
+            for name in _PROFILE_FIELD_NAMES
+            if name in data
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return cls(**{name: value for name, _, value in key})  # type: ignore[arg-type]
+        return _profile_from_items(cls, key)
 
     def to_json(self) -> str:
         """Serialise the profile to a JSON string."""
-        return json.dumps(self.to_dict())
+        payload = self._as_json
+        if payload is None:
+            payload = json.dumps(self._as_dict)
+            object.__setattr__(self, "_as_json", payload)
+        return payload
 
     @classmethod
     def from_json(cls, payload: str) -> "RuleProfile":
         """Deserialise a :class:`RuleProfile` from *payload*."""
-        return cls.from_dict(json.loads(payload))
+        return _profile_from_json(cls, payload)
 
     @property
     def pass_limit(self) -> int | None:
         """Return the numeric stock pass limit for the profile."""
 
-        return _normalise_pass_limit(self.passes)
+        if not self._pass_limit_ok:
+            return _normalise_pass_limit(self.passes)
+        return self._pass_limit
 
     def passes_remaining(self, state: Any) -> int | None:
         """Return how many stock passes remain for *state*.
@@ -166,57 +246,176 @@ class RuleProfile:
         remaining = limit - count
         return remaining if remaining > 0 else 0
 
+    def compile_legality_checker(self) -> Callable[[Any, Any], bool]:
+        """Return a ``(state, move)`` callable equivalent to :meth:`is_move_legal`.
+
+        Branches whose outcome is fixed by the profile (for example ``undo``
+        when ``undo_unlimited`` is set) are folded into constants, so hot
+        loops that evaluate many moves against one profile skip them.  The
+        checker is built once per profile.
+        """
+
+        checker = self._checker
+        if checker is None:
+            checker = _compile_legality_checker(self)
+            object.__setattr__(self, "_checker", checker)
+        return checker
+
     def is_move_legal(self, state: Any, move: Any) -> bool:
         """Determine whether *move* is allowed within *state* for this profile."""
-        action = _get_value(move, "type") or _get_value(move, "action")
+        move_value = _getter_for(type(move))
+        state_value = _getter_for(type(state))
+
+        action = move_value(move, "type") or move_value(move, "action")
         if not action:
             raise ValueError("Move must define a 'type' or 'action' attribute")
-        action = action.lower()
+        if not action.islower():
+            action = action.lower()
 
         # Enforce draw size.
-        requested_draw = _get_value(move, "draw_count")
+        requested_draw = move_value(move, "draw_count")
         if requested_draw is not None and requested_draw != self.draw:
             return False
 
-        if action == "draw":
-            return requested_draw in (None, self.draw)
-
-        if action == "stock_pass":
-            limit = self.pass_limit
-            if limit is None:
-                return True
-            passes_made = _get_value(state, "passes_made", 0)
-            return passes_made < limit
-
-        if action == "supermove":
-            move_strength = SUPERMOVE_STRENGTH.get(
-                (_get_value(move, "mode") or _get_value(move, "strength") or "standard").lower(),
-                1,
-            )
-            allowed_strength = SUPERMOVE_STRENGTH.get(self.supermove.lower(), 0)
-            return move_strength <= allowed_strength
-
-        if action == "foundation_to_tableau":
-            return self.foundation_takeback
-
-        if action == "peek":
-            return self.peek_xray
-
-        if action == "autoplay":
-            if not self.autoplay_safe_only:
-                return True
-            return bool(_get_value(move, "is_safe", False))
-
-        if action == "undo":
-            if self.undo_unlimited:
-                return True
-            remaining = _get_value(state, "undo_remaining")
-            if remaining is None:
-                remaining = max(0, 1 - _get_value(state, "undo_used", 0))
-            return remaining > 0
-
-        # Default to legal for unrecognised move types.
+        handler = _ACTION_HANDLERS.get(action)
+        if handler is None:
+            # Default to legal for unrecognised move types.
+            return True
+        return handler(self, state, move, state_value, move_value)
+
+
+_PROFILE_FIELD_NAMES = tuple(item.name for item in fields(RuleProfile) if item.init)
+
+
+@lru_cache(maxsize=128)
+def _profile_from_items(
+    cls: type[RuleProfile], items: tuple[tuple[str, type, Any], ...]
+) -> RuleProfile:
+    return cls(**{name: value for name, _, value in items})
+
+
+@lru_cache(maxsize=128)
+def _profile_from_json(cls: type[RuleProfile], payload: str) -> RuleProfile:
+    return cls.from_dict(json.loads(payload))
+
+
+_Accessor = Callable[..., Any]
+
+
+def _draw_is_legal(
+    profile: RuleProfile, state: Any, move: Any, state_value: _Accessor, move_value: _Accessor
+) -> bool:
+    # Mismatched draw sizes are rejected before dispatch.
+    return True
+
+
+def _stock_pass_is_legal(
+    profile: RuleProfile, state: Any, move: Any, state_value: _Accessor, move_value: _Accessor
+) -> bool:
+    limit = profile.pass_limit
+    if limit is None:
+        return True
+    passes_made = state_value(state, "passes_made", 0)
+    return passes_made < limit
+
+
+def _supermove_is_legal(
+    profile: RuleProfile, state: Any, move: Any, state_value: _Accessor, move_value: _Accessor
+) -> bool:
+    move_strength = SUPERMOVE_STRENGTH.get(
+        (move_value(move, "mode") or move_value(move, "strength") or "standard").lower(),
+        1,
+    )
+    return move_strength <= profile._allowed_strength
+
+
+def _foundation_to_tableau_is_legal(
+    profile: RuleProfile, state: Any, move: Any, state_value: _Accessor, move_value: _Accessor
+) -> bool:
+    return profile.foundation_takeback
+
+
+def _peek_is_legal(
+    profile: RuleProfile, state: Any, move: Any, state_value: _Accessor, move_value: _Accessor
+) -> bool:
+    return profile.peek_xray
+
+
+def _autoplay_is_legal(
+    profile: RuleProfile, state: Any, move: Any, state_value: _Accessor, move_value: _Accessor
+) -> bool:
+    if not profile.autoplay_safe_only:
         return True
+    return bool(move_value(move, "is_safe", False))
+
+
+def _undo_is_legal(
+    profile: RuleProfile, state: Any, move: Any, state_value: _Accessor, move_value: _Accessor
+) -> bool:
+    if profile.undo_unlimited:
+        return True
+    remaining = state_value(state, "undo_remaining")
+    if remaining is None:
+        remaining = max(0, 1 - state_value(state, "undo_used", 0))
+    return remaining > 0
+
+
+_ACTION_HANDLERS: dict[str, Callable[..., bool]] = {
+    "draw": _draw_is_legal,
+    "stock_pass": _stock_pass_is_legal,
+    "supermove": _supermove_is_legal,
+    "foundation_to_tableau": _foundation_to_tableau_is_legal,
+    "peek": _peek_is_legal,
+    "autoplay": _autoplay_is_legal,
+    "undo": _undo_is_legal,
+}
+
+
+def _compile_legality_checker(profile: RuleProfile) -> Callable[[Any, Any], bool]:
+    """Specialise the action table to *profile*; see ``compile_legality_checker``."""
+
+    def generic(action: str) -> Callable[[Any, Any, _Accessor], bool]:
+        handler = _ACTION_HANDLERS[action]
+
+        def check(state: Any, move: Any, move_value: _Accessor) -> bool:
+            return handler(profile, state, move, _getter_for(type(state)), move_value)
+
+        return check
+
+    # Each entry is either a constant verdict or a residual check.
+    outcomes: dict[str, bool | Callable[[Any, Any, _Accessor], bool]] = {
+        "draw": True,
+        "foundation_to_tableau": bool(profile.foundation_takeback),
+        "peek": bool(profile.peek_xray),
+        "supermove": generic("supermove"),
+    }
+    if profile._pass_limit_ok and profile._pass_limit is None:
+        outcomes["stock_pass"] = True
+    else:
+        outcomes["stock_pass"] = generic("stock_pass")
+    outcomes["autoplay"] = True if not profile.autoplay_safe_only else generic("autoplay")
+    outcomes["undo"] = True if profile.undo_unlimited else generic("undo")
+
+    draw = profile.draw
+
+    def is_move_legal(state: Any, move: Any) -> bool:
+        move_value = _getter_for(type(move))
+        action = move_value(move, "type") or move_value(move, "action")
+        if not action:
+            raise ValueError("Move must define a 'type' or 'action' attribute")
+        if not action.islower():
+            action = action.lower()
+
+        requested_draw = move_value(move, "draw_count")
+        if requested_draw is not None and requested_draw != draw:
+            return False
+
+        outcome = outcomes.get(action, True)
+        if outcome is True or outcome is False:
+            return outcome
+        return outcome(state, move, move_value)
+
+    return is_move_legal
 
 
 MAX_RELAX = RuleProfile(
@@ -4,9 +4,11 @@
 from __future__ import annotations
 
 import argparse
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 SUITS = ("spades", "hearts", "clubs", "diamonds")
@@ -17,9 +19,37 @@ SUIT_COLORS = {
     "diamonds": "red",
 }
 RANKS = tuple(range(1, 14))
-
-
-@dataclass
+CARD_COUNT = len(SUITS) * len(RANKS)
+
+# The solver works on integer card ids (``suit_index * 13 + rank - 1``) so the
+# greedy loop only touches ints and small lists.  These tables decode an id
+# without any attribute or dictionary lookups.
+SUIT_INDEX = {suit: index for index, suit in enumerate(SUITS)}
+RANK_OF = tuple(card % 13 + 1 for card in range(CARD_COUNT))
+SUIT_OF = tuple(card // 13 for card in range(CARD_COUNT))
+COLOR_OF = tuple(
+    0 if SUIT_COLORS[SUITS[card // 13]] == "black" else 1 for card in range(CARD_COUNT)
+)
+KING = 13
+RANK_LABELS = ("", "A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+BASE_DECK = tuple(range(CARD_COUNT))
+
+# ``CAN_STACK[top * CARD_COUNT + card]`` is non-zero when *card* may be placed
+# on *top* in the tableau.  Row ``EMPTY_COLUMN`` describes an empty column,
+# which only accepts kings.
+EMPTY_COLUMN = CARD_COUNT
+CAN_STACK = bytearray((CARD_COUNT + 1) * CARD_COUNT)
+for _top in range(CARD_COUNT):
+    for _card in range(CARD_COUNT):
+        if COLOR_OF[_top] != COLOR_OF[_card] and RANK_OF[_top] == RANK_OF[_card] + 1:
+            CAN_STACK[_top * CARD_COUNT + _card] = 1
+for _card in range(CARD_COUNT):
+    if RANK_OF[_card] == KING:
+        CAN_STACK[EMPTY_COLUMN * CARD_COUNT + _card] = 1
+del _top, _card
+
+
+@dataclass(slots=True)
 class Card:
     """Simple representation of a playing card."""
 
@@ -27,25 +57,42 @@ class Card:
     suit: str
     face_up: bool = False
 
+    @classmethod
+    def from_id(cls, card_id: int, face_up: bool = False) -> "Card":
+        return cls(RANK_OF[card_id], SUITS[SUIT_OF[card_id]], face_up)
+
+    @property
+    def card_id(self) -> int:
+        return SUIT_INDEX[self.suit] * 13 + self.rank - 1
+
     @property
     def color(self) -> str:
         return SUIT_COLORS[self.suit]
 
     def label(self) -> str:
-        mapping = {
-            1: "A",
-            11: "J",
-            12: "Q",
-            13: "K",
-        }
-        return mapping.get(self.rank, str(self.rank))
+        if 0 < self.rank < len(RANK_LABELS):
+            return RANK_LABELS[self.rank]
+        return str(self.rank)
 
     def __str__(self) -> str:  # pragma: no cover - debug helper
         return f"{self.label()}{self.suit[0].upper()}"
 
 
 class KlondikeSolver:
-    """Greedy Klondike solver with deterministic shuffles."""
+    """Greedy Klondike solver with deterministic shuffles.
+
+    Internally each tableau column is a list of card ids paired with an
+    integer mask whose bit *i* is set when position *i* is face up.  The stock
+    and waste are plain id lists (face down and face up respectively) and the
+    foundations only track the top rank per suit.  :class:`Card` objects are
+    built on demand by the ``tableau``/``stock``/``waste``/``foundations``
+    views for inspection and debugging.
+
+    The id lists are deliberately plain ``list`` objects rather than
+    ``array.array('b')`` buffers: small ints are cached by CPython, so a list
+    read is a pointer copy, whereas every array read or ``pop`` boxes a fresh
+    int and measures 20-200% slower for the operations the greedy loop uses.
+    """
 
     def __init__(
         self,
@@ -63,95 +110,127 @@ class KlondikeSolver:
         self.pass_limit = pass_limit
         self.shuffle_seed = shuffle_seed & 0xFFFFFFFF
         self._base_rng = random.Random(self.shuffle_seed)
-        self._initial_deck = list(deck) if deck is not None else None
+        self._initial_deck = (
+            [card.card_id for card in deck] if deck is not None else None
+        )
         self.setup()
 
     def setup(self) -> None:
         """Deal a fresh game using the configured shuffle seed."""
 
         deck = self._build_deck()
-        self.tableau: List[List[Card]] = [list() for _ in range(7)]
+        self._columns: List[List[int]] = [list() for _ in range(7)]
+        self._face_up: List[int] = [0] * 7
         for column in range(7):
             for row in range(column + 1):
-                card = deck.pop()
-                card.face_up = row == column
-                self.tableau[column].append(card)
-
-        self.stock: List[Card] = deck
-        for card in self.stock:
-            card.face_up = False
-
-        self.waste: List[Card] = []
-        self.foundations = {suit: [] for suit in SUITS}
+                self._columns[column].append(deck.pop())
+            self._face_up[column] = 1 << column
+
+        self._stock: List[int] = deck
+        self._waste: List[int] = []
+        self._foundations: List[int] = [0] * len(SUITS)
+        # Set once both tableau scans come up empty; cleared by any change to
+        # the tableau or foundations (see resolve_forced_moves).
+        self._tableau_settled = False
         self.moves = 0
         self.passes_used = 0
 
+    # ------------------------------------------------------------------
+    # Card views
+    # ------------------------------------------------------------------
+    @property
+    def tableau(self) -> List[List[Card]]:
+        return [
+            [
+                Card.from_id(card, bool(mask >> position & 1))
+                for position, card in enumerate(column)
+            ]
+            for column, mask in zip(self._columns, self._face_up)
+        ]
+
+    @property
+    def stock(self) -> List[Card]:
+        return [Card.from_id(card) for card in self._stock]
+
+    @property
+    def waste(self) -> List[Card]:
+        return [Card.from_id(card, True) for card in self._waste]
+
+    @property
+    def foundations(self) -> Dict[str, List[Card]]:
+        return {
+            suit: [Card(rank, suit, True) for rank in range(1, top + 1)]
+            for suit, top in zip(SUITS, self._foundations)
+        }
+
     # ------------------------------------------------------------------
     # Deck helpers
     # ------------------------------------------------------------------
-    def _build_deck(self) -> List[Card]:
+    def _build_deck(self) -> List[int]:
         if self._initial_deck is not None:
-            deck = [Card(card.rank, card.suit, card.face_up) for card in self._initial_deck]
+            deck = list(self._initial_deck)
         else:
-            deck = [Card(rank, suit) for suit in SUITS for rank in RANKS]
+            deck = list(BASE_DECK)
             self._base_rng.shuffle(deck)
         return deck
 
     # ------------------------------------------------------------------
     # Core move operations
     # ------------------------------------------------------------------
-    def can_move_to_foundation(self, card: Card) -> bool:
-        foundation = self.foundations[card.suit]
-        if not foundation:
-            return card.rank == 1
-        return foundation[-1].rank == card.rank - 1
-
-    def move_to_foundation(self, card: Card) -> None:
-        self.foundations[card.suit].append(card)
+    def can_move_to_foundation(self, card: int) -> bool:
+        return RANK_OF[card] == self._foundations[SUIT_OF[card]] + 1
+
+    def move_to_foundation(self, card: int) -> None:
+        self._foundations[SUIT_OF[card]] = RANK_OF[card]
+        self._tableau_settled = False
         self.moves += 1
 
     def flip_tableau_if_needed(self, index: int) -> None:
-        column = self.tableau[index]
-        if column and not column[-1].face_up:
-            column[-1].face_up = True
+        column = self._columns[index]
+        if column:
+            self._face_up[index] |= 1 << (len(column) - 1)
 
-    def can_stack_on_tableau(self, card: Card, column: List[Card]) -> bool:
+    def can_stack_on_tableau(self, card: int, index: int) -> bool:
+        column = self._columns[index]
         if not column:
-            return card.rank == 13
-        top = column[-1]
-        if not top.face_up:
+            return CAN_STACK[EMPTY_COLUMN * CARD_COUNT + card] != 0
+        top_position = len(column) - 1
+        if not self._face_up[index] >> top_position & 1:
             return False
-        return top.color != card.color and top.rank == card.rank + 1
+        return CAN_STACK[column[top_position] * CARD_COUNT + card] != 0
 
     def move_stack(self, src_index: int, start_idx: int, dest_index: int) -> None:
-        column = self.tableau[src_index]
-        stack = column[start_idx:]
+        column = self._columns[src_index]
+        dest_column = self._columns[dest_index]
+        self._face_up[dest_index] |= (self._face_up[src_index] >> start_idx) << len(
+            dest_column
+        )
+        self._face_up[src_index] &= (1 << start_idx) - 1
+        dest_column.extend(column[start_idx:])
         del column[start_idx:]
-        self.tableau[dest_index].extend(stack)
+        self._tableau_settled = False
         self.moves += 1
         self.flip_tableau_if_needed(src_index)
 
     def draw_from_stock(self) -> bool:
-        if not self.stock:
+        if not self._stock:
             return False
-        draw_count = min(self.draw_count, len(self.stock))
+        draw_count = min(self.draw_count, len(self._stock))
         for _ in range(draw_count):
-            card = self.stock.pop()
-            card.face_up = True
-            self.waste.append(card)
+            self._waste.append(self._stock.pop())
         self.moves += 1
         return True
 
     def recycle_stock(self) -> bool:
-        if not self.waste:
+        if not self._waste:
             return False
         if self.pass_limit is not None and self.passes_used >= self.pass_limit:
             return False
-        cards = list(reversed(self.waste))
-        self.waste.clear()
-        for card in cards:
-            card.face_up = False
-        self.stock.extend(cards)
+        # Waste ids carry no face-up flag, so turning the pile over is a
+        # reverse in place followed by a single extend.
+        self._waste.reverse()
+        self._stock.extend(self._waste)
+        self._waste.clear()
         self.passes_used += 1
         return True
 
@@ -159,91 +238,105 @@ class KlondikeSolver:
     # Greedy strategies
     # ------------------------------------------------------------------
     def try_promote_waste_to_foundation(self) -> bool:
-        if not self.waste:
+        if not self._waste:
             return False
-        card = self.waste[-1]
+        card = self._waste[-1]
         if not self.can_move_to_foundation(card):
             return False
-        self.waste.pop()
+        self._waste.pop()
         self.move_to_foundation(card)
         return True
 
     def try_promote_tableau_to_foundation(self) -> bool:
-        made_move = False
-        for index, column in enumerate(self.tableau):
-            if not column or not column[-1].face_up:
+        for index, column in enumerate(self._columns):
+            if not column or not self._face_up[index] >> (len(column) - 1) & 1:
                 continue
             card = column[-1]
             if self.can_move_to_foundation(card):
                 column.pop()
+                self._face_up[index] &= (1 << len(column)) - 1
                 self.move_to_foundation(card)
                 self.flip_tableau_if_needed(index)
-                made_move = True
-                break
-        return made_move
+                return True
+        return False
 
     def try_move_waste_to_tableau(self) -> bool:
-        if not self.waste:
+        if not self._waste:
             return False
-        card = self.waste[-1]
+        card = self._waste[-1]
         best_target: Optional[int] = None
         best_priority = -1
-        for index, column in enumerate(self.tableau):
-            if not self.can_stack_on_tableau(card, column):
+        for index, column in enumerate(self._columns):
+            if not self.can_stack_on_tableau(card, index):
                 continue
-            priority = 0
             if not column:
                 priority = 2
-            elif any(not c.face_up for c in column):
+            elif self._face_up[index] != (1 << len(column)) - 1:
+                # Prefer columns that still hide face-down cards.
                 priority = 3
-            elif column and column[-1].face_up:
+            else:
                 priority = 1
             if priority > best_priority:
                 best_target = index
                 best_priority = priority
         if best_target is None:
             return False
-        self.tableau[best_target].append(self.waste.pop())
+        dest_column = self._columns[best_target]
+        self._face_up[best_target] |= 1 << len(dest_column)
+        dest_column.append(self._waste.pop())
+        self._tableau_settled = False
         self.moves += 1
         return True
 
     def try_move_tableau_to_tableau(self) -> bool:
-        for src_index, column in enumerate(self.tableau):
+        columns = self._columns
+        face_up = self._face_up
+        # Resolve each destination to its CAN_STACK row once per scan rather
+        # than once per (source, destination) pair; -1 marks a column whose
+        # top card is still face down.
+        rows: List[int] = []
+        for index, column in enumerate(columns):
             if not column:
+                rows.append(EMPTY_COLUMN * CARD_COUNT)
+            elif face_up[index] >> (len(column) - 1) & 1:
+                rows.append(column[-1] * CARD_COUNT)
+            else:
+                rows.append(-1)
+
+        for src_index, column in enumerate(columns):
+            mask = face_up[src_index]
+            first_face_up = (mask & -mask).bit_length() - 1
+            # Only move runs that uncover a face-down card; this also rules
+            # out shuffling a lone king between empty columns.
+            if first_face_up <= 0:
                 continue
-            first_face_up = next((i for i, card in enumerate(column) if card.face_up), None)
-            if first_face_up is None:
-                continue
-            stack = column[first_face_up:]
-            has_hidden_card = first_face_up > 0
-            for dest_index, dest_column in enumerate(self.tableau):
-                if dest_index == src_index:
-                    continue
-                if not self.can_stack_on_tableau(stack[0], dest_column):
-                    continue
-                if dest_column and not has_hidden_card:
-                    continue
-                if not dest_column and (stack[0].rank != 13 or not has_hidden_card):
-                    continue
-                self.move_stack(src_index, first_face_up, dest_index)
-                return True
+            lead = column[first_face_up]
+            for dest_index, row in enumerate(rows):
+                if row >= 0 and dest_index != src_index and CAN_STACK[row + lead]:
+                    self.move_stack(src_index, first_face_up, dest_index)
+                    return True
         return False
 
     def resolve_forced_moves(self) -> bool:
+        # The two tableau scans only depend on the tableau and foundations.
+        # Once both fail they are skipped until one of those changes, which
+        # spares the full column sweeps while the stock is being cycled.
+        # Pass order, and therefore the greedy move sequence, is unchanged.
         moved = False
         while True:
             if self.try_promote_waste_to_foundation():
                 moved = True
                 continue
-            if self.try_promote_tableau_to_foundation():
+            if not self._tableau_settled and self.try_promote_tableau_to_foundation():
                 moved = True
                 continue
             if self.try_move_waste_to_tableau():
                 moved = True
                 continue
-            if self.try_move_tableau_to_tableau():
+            if not self._tableau_settled and self.try_move_tableau_to_tableau():
                 moved = True
                 continue
+            self._tableau_settled = True
             break
         return moved
 
@@ -251,10 +344,10 @@ class KlondikeSolver:
     # Game loop
     # ------------------------------------------------------------------
     def foundation_count(self) -> int:
-        return sum(len(pile) for pile in self.foundations.values())
+        return sum(self._foundations)
 
     def is_won(self) -> bool:
-        return self.foundation_count() == 52
+        return self.foundation_count() == CARD_COUNT
 
     def play(self, *, max_steps: int = 5000) -> dict:
         steps = 0
@@ -273,13 +366,25 @@ class KlondikeSolver:
             "seed": self.shuffle_seed,
             "draw_count": self.draw_count,
             "foundations": self.foundation_count(),
-            "stock_remaining": len(self.stock),
-            "waste": len(self.waste),
+            "stock_remaining": len(self._stock),
+            "waste": len(self._waste),
             "steps": steps,
         }
 
 
-def parse_arguments() -> argparse.Namespace:
+def _play_seed(job: Tuple[int, int, Optional[int], int]) -> dict:
+    """Play a single game described by ``(seed, draw_count, pass_limit, max_steps)``."""
+
+    seed, draw_count, pass_limit, max_steps = job
+    solver = KlondikeSolver(
+        draw_count=draw_count,
+        pass_limit=pass_limit,
+        shuffle_seed=seed,
+    )
+    return solver.play(max_steps=max_steps)
+
+
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--seed",
@@ -310,37 +415,52 @@ def parse_arguments() -> argparse.Namespace:
         default=5000,
         help="Fail-safe iteration cap to avoid infinite loops (default: 5000).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to play games in parallel. Use 0 for one per CPU (default: 1).",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
         help="Suppress per-game output and only print the summary line.",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def run_cli() -> None:
-    args = parse_arguments()
+def run_cli(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_arguments(argv)
     master_seed = args.seed if args.seed is not None else random.randrange(0, 2**32)
     master_rng = random.Random(master_seed)
     pass_limit: Optional[int]
     pass_limit = None if args.pass_limit < 0 else args.pass_limit
 
-    wins = 0
-    total_moves = 0
-    total_foundations = 0
-
+    # Seeds are drawn up front so a batch replays identically whatever the
+    # number of worker processes.
+    jobs: List[Tuple[int, int, Optional[int], int]] = []
     for game_index in range(args.games):
         if game_index == 0 and args.seed is not None:
             seed = args.seed & 0xFFFFFFFF
         else:
             seed = master_rng.randrange(0, 2**32)
+        jobs.append((seed, args.draw_count, pass_limit, args.max_steps))
 
-        solver = KlondikeSolver(
-            draw_count=args.draw_count,
-            pass_limit=pass_limit,
-            shuffle_seed=seed,
-        )
-        result = solver.play(max_steps=args.max_steps)
+    workers = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+
+    wins = 0
+    total_moves = 0
+    total_foundations = 0
+
+    results: Iterable[dict]
+    if workers > 1 and len(jobs) > 1:
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_play_seed, jobs, chunksize=chunksize))
+    else:
+        results = map(_play_seed, jobs)
+
+    for game_index, result in enumerate(results):
         total_moves += result["moves"]
         total_foundations += result["foundations"]
         if result["won"]:
@@ -349,14 +469,10 @@ def run_cli() -> None:
         if not args.quiet:
             status = "win" if result["won"] else "loss"
             print(
-                f"Game {game_index + 1}: seed={seed} moves={result['moves']} "
+                f"Game {game_index + 1}: seed={result['seed']} moves={result['moves']} "
                 f"passes={result['passes_used']} foundations={result['foundations']} status={status}"
             )
 
-        if result["won"] and args.games == 1:
-            # One last pass to make sure we report the final tableau when helpful.
-            continue
-
     win_rate = (wins / args.games) * 100 if args.games else 0.0
     average_moves = total_moves / args.games if args.games else 0.0
     average_foundations = total_foundations / args.games if args.games else 0.0
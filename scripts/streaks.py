@@ -3,15 +3,24 @@
 from __future__ import annotations
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Iterable, Sequence
 
-from scripts.validate import DatasetError, Record, load_records
+from scripts.validate import DatasetError, Record, load_columns
 
 
 TRACKED_RESULTS = {"win", "loss"}
 
+_WIN_CODE = "W"
+_LOSS_CODE = "L"
+_UNTRACKED_CODE = "-"
+_RESULT_CODES = {"win": _WIN_CODE, "loss": _LOSS_CODE}
+_CODE_RESULTS = {code: result for result, code in _RESULT_CODES.items()}
+
 
 @dataclass(frozen=True)
 class StreakSummary:
@@ -33,53 +42,67 @@ def _normalise_result(result: str | None) -> str:
 def compute_streak_summary(
     records: Sequence[Record], *, abandoned_as_loss: bool = False
 ) -> StreakSummary:
-    total = len(records)
-    wins = 0
-    losses = 0
-    longest = {"win": 0, "loss": 0}
-    current_result: str | None = None
-    current_length = 0
-
-    for record in records:
-        result = _normalise_result(record.result)
-        tracked_result = result
-        if result == "abandoned" and abandoned_as_loss:
-            tracked_result = "loss"
-
-        if tracked_result == "win":
-            wins += 1
-        elif tracked_result == "loss":
-            losses += 1
-
-        if tracked_result not in TRACKED_RESULTS:
-            current_result = None
-            current_length = 0
-            continue
+    return compute_result_streaks(
+        [record.result for record in records], abandoned_as_loss=abandoned_as_loss
+    )
 
-        if tracked_result == current_result:
-            current_length += 1
-        else:
-            current_result = tracked_result
-            current_length = 1
 
-        if current_length > longest[tracked_result]:
-            longest[tracked_result] = current_length
+def compute_result_streaks(
+    results: Sequence[str | None], *, abandoned_as_loss: bool = False
+) -> StreakSummary:
+    """Return streak statistics for a column of per-attempt result labels."""
+
+    # Attempt logs repeat a handful of result labels, so the code table is
+    # built from the distinct raw values only and applied to the column with
+    # a C-level ``map``.  Each attempt becomes one character ("W", "L" or
+    # "-" for any untracked result), so the streak scan below is a handful of
+    # C-level string operations instead of a per-record Python loop.
+    codes_for: dict[str | None, str] = {}
+    for raw in set(results):
+        token = _normalise_result(raw)
+        if abandoned_as_loss and token == "abandoned":
+            token = "loss"
+        codes_for[raw] = _RESULT_CODES.get(token, _UNTRACKED_CODE)
+    codes = "".join(map(codes_for.__getitem__, results))
 
-    if current_result not in TRACKED_RESULTS:
-        current_result = None
-        current_length = 0
+    current_result: str | None = None
+    current_length = 0
+    last = codes[-1:]
+    if last and last != _UNTRACKED_CODE:
+        current_result = _CODE_RESULTS[last]
+        current_length = len(codes) - len(codes.rstrip(last))
 
     return StreakSummary(
-        total_records=total,
-        wins=wins,
-        losses=losses,
-        longest_win_streak=longest["win"],
-        longest_loss_streak=longest["loss"],
+        total_records=len(results),
+        wins=codes.count(_WIN_CODE),
+        losses=codes.count(_LOSS_CODE),
+        longest_win_streak=_longest_run(codes, _WIN_CODE),
+        longest_loss_streak=_longest_run(codes, _LOSS_CODE),
         current_streak_result=current_result,
         current_streak_length=current_length,
     )
 
 
+def _longest_run(codes: str, code: str) -> int:
+    """Return the length of the longest run of *code* characters in *codes*.
+
+    A run of length ``n`` exists exactly when ``code * n`` is a substring, so
+    the answer is found by galloping then bisecting on that C-level substring
+    search, without splitting *codes* into a list of runs.
+    """
+
+    shorter, longer = 0, 1
+    while code * longer in codes:
+        shorter, longer = longer, longer * 2
+    while longer - shorter > 1:
+        middle = (shorter + longer) // 2
+        if code * middle in codes:
+            shorter = middle
+        else:
+            longer = middle
+    return shorter
+
+
 def format_streak_summary(path: Path, summary: StreakSummary) -> str:
     lines = [f"{path}: {summary.total_records} records"]
     lines.append(f"  wins={summary.wins} losses={summary.losses}")
@@ -95,19 +118,22 @@ def format_streak_summary(path: Path, summary: StreakSummary) -> str:
 
 
 def summarise_path(path: Path, *, abandoned_as_loss: bool = False) -> StreakSummary:
-    records = load_records(path)
-    return compute_streak_summary(records, abandoned_as_loss=abandoned_as_loss)
+    results = load_columns(path, ("result",))["result"]
+    return compute_result_streaks(results, abandoned_as_loss=abandoned_as_loss)
 
 
 def run(
-    paths: Iterable[str], *, abandoned_as_loss: bool = False
+    paths: Iterable[str], *, abandoned_as_loss: bool = False, jobs: int = 1
 ) -> list[tuple[Path, StreakSummary]]:
-    results: list[tuple[Path, StreakSummary]] = []
-    for raw_path in paths:
-        path = Path(raw_path)
-        summary = summarise_path(path, abandoned_as_loss=abandoned_as_loss)
-        results.append((path, summary))
-    return results
+    resolved = [Path(raw_path) for raw_path in paths]
+    summarise = partial(summarise_path, abandoned_as_loss=abandoned_as_loss)
+    workers = jobs if jobs > 0 else os.cpu_count() or 1
+    if workers > 1 and len(resolved) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(resolved))) as executor:
+            summaries = list(executor.map(summarise, resolved))
+    else:
+        summaries = [summarise(path) for path in resolved]
+    return list(zip(resolved, summaries))
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -125,6 +151,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Count 'abandoned' attempts as losses when computing streaks.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to analyse files in parallel. Use 0 for one per CPU (default: 1).",
+    )
     return parser
 
 
@@ -133,7 +165,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     try:
-        summaries = run(args.paths, abandoned_as_loss=args.abandoned_as_loss)
+        summaries = run(
+            args.paths, abandoned_as_loss=args.abandoned_as_loss, jobs=args.jobs
+        )
     except DatasetError as exc:
         parser.error(str(exc))
 
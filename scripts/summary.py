@@ -2,13 +2,20 @@
 from __future__ import annotations
 
 import argparse
+import importlib
+import importlib.util
 import json
-from dataclasses import asdict, dataclass
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache, partial
+from itertools import compress
 from pathlib import Path
-from statistics import mean, median
-from typing import Iterable, Sequence
+from statistics import fmean
+from typing import Callable, Iterable, Sequence
 
-from scripts.validate import DatasetError, Record, load_records
+from scripts.validate import DatasetError, Record, load_columns
 
 
 @dataclass(frozen=True)
@@ -27,69 +34,154 @@ class Summary:
     longest_duration_ms: int | None
 
 
+@lru_cache(maxsize=64)
 def _normalise_result(value: str | None) -> str:
-    """Return a lowercase representation of *value* suitable for comparisons."""
+    """Return a lowercase representation of *value* suitable for comparisons.
+
+    Result labels repeat heavily across a dataset, so the normalised form is
+    cached rather than rebuilt for every record.
+    """
 
     return (value or "").strip().lower()
 
 
-def _should_include(
-    result: str,
-    include_results: set[str] | None,
-    exclude_results: set[str] | None,
-) -> bool:
-    """Return ``True`` when *result* passes the inclusion rules."""
+@lru_cache(maxsize=64)
+def _result_label(value: str | None) -> str:
+    """Return the label *value* is counted under in ``result_counts``."""
+
+    return _normalise_result(value) or "unknown"
+
+
+def _result_set(values: Iterable[str] | None) -> frozenset[str]:
+    """Return the normalised, de-duplicated labels in *values*."""
+
+    return frozenset(map(_normalise_result, values or ()))
 
-    if include_results and result not in include_results:
-        return False
-    if exclude_results and result in exclude_results:
-        return False
-    return True
+
+def _result_filter(
+    include_results: Iterable[str] | None,
+    exclude_results: Iterable[str] | None,
+) -> Callable[[str | None], bool] | None:
+    """Return a predicate over raw result labels, or ``None`` to keep everything.
+
+    The inclusion rules are resolved once here, so the per-record check is a
+    single set lookup: an include list minus the excluded labels, or just the
+    exclusions when no include list is given.
+    """
+
+    include_set = _result_set(include_results)
+    exclude_set = _result_set(exclude_results)
+    if include_set:
+        allowed = include_set - exclude_set
+        return lambda result: _normalise_result(result) in allowed
+    if exclude_set:
+        return lambda result: _normalise_result(result) not in exclude_set
+    return None
 
 
 def filter_records(
     records: Sequence[Record],
-    include_results: Sequence[str] | None = None,
-    exclude_results: Sequence[str] | None = None,
+    include_results: Iterable[str] | None = None,
+    exclude_results: Iterable[str] | None = None,
 ) -> list[Record]:
     """Return *records* filtered by optional result inclusion/exclusion lists."""
 
-    include_set = {_normalise_result(value) for value in include_results or []}
-    exclude_set = {_normalise_result(value) for value in exclude_results or []}
+    keep = _result_filter(include_results, exclude_results)
+    if keep is None:
+        return list(records)
+    return [record for record in records if keep(record.result)]
+
 
-    filtered: list[Record] = []
-    for record in records:
-        result = _normalise_result(record.result)
-        if _should_include(result, include_set or None, exclude_set or None):
-            filtered.append(record)
-    return filtered
+# Below this many samples list.sort beats the cost of building an array.
+_NUMPY_MIN_SAMPLES = 4096
+
+
+def _median_and_max(samples: list[int]) -> tuple[float, int]:
+    """Return the median and maximum of the non-empty integer *samples*.
+
+    Large columns are loaded into an ``int64`` NumPy array when numpy is
+    installed and the middle values are found with ``np.partition``, a linear
+    selection, rather than a full sort.  Otherwise, or when values do not fit
+    in ``int64``, *samples* is sorted in place.
+    """
+
+    if len(samples) >= _NUMPY_MIN_SAMPLES and importlib.util.find_spec("numpy"):
+        np = importlib.import_module("numpy")
+        try:
+            values = np.array(samples, dtype=np.int64)
+        except OverflowError:
+            values = None
+        if values is not None:
+            middle = len(values) // 2
+            if len(values) % 2:
+                median = int(np.partition(values, middle)[middle])
+            else:
+                lower, upper = np.partition(values, (middle - 1, middle))[
+                    middle - 1 : middle + 1
+                ].tolist()
+                median = (lower + upper) / 2
+            return median, int(values.max())
+    samples.sort()
+    return _sorted_median(samples), samples[-1]
+
+
+def _sorted_median(ordered: Sequence[int]) -> float:
+    """Return the median of the already sorted *ordered*, as ``statistics.median`` would."""
+
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
 
 
 def summarise_records(records: Sequence[Record]) -> Summary:
     """Return aggregate statistics for *records*."""
 
-    total = len(records)
+    return summarise_columns(
+        [record.result for record in records],
+        [record.moves for record in records],
+        [record.duration_ms for record in records],
+    )
+
+
+def summarise_columns(
+    results: Sequence[str | None],
+    moves: Sequence[int | None],
+    durations: Sequence[int | None],
+) -> Summary:
+    """Return aggregate statistics for parallel per-attempt columns.
+
+    The sequences hold one entry per attempt, as produced by
+    :func:`scripts.validate.load_columns`.
+    """
+
+    total = len(results)
+    # Attempt logs repeat a handful of raw labels, so they are counted as-is
+    # in one C-level pass and only the distinct values are normalised.
+    raw_counts = Counter(results)
     result_counts: dict[str, int] = {}
-    wins = 0
-    move_samples: list[int] = []
+    for raw, count in raw_counts.items():
+        label = _result_label(raw)
+        result_counts[label] = result_counts.get(label, 0) + count
+    wins = result_counts.get("win", 0)
+
+    move_samples = [move_count for move_count in moves if move_count is not None]
+    duration_samples = [duration for duration in durations if duration is not None]
     win_move_samples: list[int] = []
-    duration_samples: list[int] = []
     win_duration_samples: list[int] = []
-
-    for record in records:
-        result = _normalise_result(record.result) or "unknown"
-        result_counts[result] = result_counts.get(result, 0) + 1
-        if result == "win":
-            wins += 1
-
-        if record.moves is not None:
-            move_samples.append(record.moves)
-            if result == "win":
-                win_move_samples.append(record.moves)
-        if record.duration_ms is not None:
-            duration_samples.append(record.duration_ms)
-            if result == "win":
-                win_duration_samples.append(record.duration_ms)
+    if wins:
+        win_values = {raw for raw in raw_counts if _result_label(raw) == "win"}
+        is_win = list(map(win_values.__contains__, results))
+        win_move_samples = [
+            move_count
+            for move_count in compress(moves, is_win)
+            if move_count is not None
+        ]
+        win_duration_samples = [
+            duration
+            for duration in compress(durations, is_win)
+            if duration is not None
+        ]
 
     win_rate: float | None
     if total > 0:
@@ -100,8 +192,8 @@ def summarise_records(records: Sequence[Record]) -> Summary:
     average_moves: float | None
     median_moves: float | None
     if move_samples:
-        average_moves = mean(move_samples)
-        median_moves = median(move_samples)
+        average_moves = fmean(move_samples)
+        median_moves, _ = _median_and_max(move_samples)
     else:
         average_moves = None
         median_moves = None
@@ -110,9 +202,8 @@ def summarise_records(records: Sequence[Record]) -> Summary:
     median_duration: float | None
     longest_duration: int | None
     if duration_samples:
-        average_duration = mean(duration_samples)
-        median_duration = median(duration_samples)
-        longest_duration = max(duration_samples)
+        average_duration = fmean(duration_samples)
+        median_duration, longest_duration = _median_and_max(duration_samples)
     else:
         average_duration = None
         median_duration = None
@@ -176,30 +267,249 @@ def format_summary(path: Path, summary: Summary) -> str:
 
 def summarise_path(
     path: Path,
-    include_results: Sequence[str] | None = None,
-    exclude_results: Sequence[str] | None = None,
+    include_results: Iterable[str] | None = None,
+    exclude_results: Iterable[str] | None = None,
+) -> Summary:
+    """Load records from *path* and return their summary.
+
+    Summaries are cached per version of the file: the cache key includes its
+    modification time and size, so a rewritten file is read again.  Each call
+    returns its own ``result_counts`` dict, so callers cannot alter the cache.
+    """
+
+    include_set = _result_set(include_results)
+    exclude_set = _result_set(exclude_results)
+    try:
+        stat = path.stat()
+    except OSError:
+        # Let the loader report an unsupported extension, a missing optional
+        # dependency or the missing file itself, as an uncached read would.
+        return _summarise_file_uncached(path, include_set, exclude_set)
+    summary = _summarise_file(
+        path.resolve(), stat.st_mtime_ns, stat.st_size, include_set, exclude_set
+    )
+    return replace(summary, result_counts=dict(summary.result_counts))
+
+
+@lru_cache(maxsize=128)
+def _summarise_file(
+    path: Path,
+    mtime_ns: int,
+    size: int,
+    include_results: frozenset[str],
+    exclude_results: frozenset[str],
+) -> Summary:
+    """Summarise *path*; *mtime_ns* and *size* only key the cache."""
+
+    return _summarise_file_uncached(path, include_results, exclude_results)
+
+
+def _summarise_file_uncached(
+    path: Path, include_results: frozenset[str], exclude_results: frozenset[str]
+) -> Summary:
+    columns = load_columns(path, ("result", "moves", "duration_ms"))
+    results = columns["result"]
+    moves = columns["moves"]
+    durations = columns["duration_ms"]
+
+    keep = _result_filter(include_results, exclude_results)
+    if keep is not None:
+        mask = list(map(keep, results))
+        results = list(compress(results, mask))
+        moves = list(compress(moves, mask))
+        durations = list(compress(durations, mask))
+
+    return summarise_columns(results, moves, durations)
+
+
+# Text that int(value, 10) may read but a polars Int64 cast does not: digits
+# from any script, "_" separators, and the \x1c-\x1f separators str.strip()
+# removes but the regex ``\s`` class does not.
+_POLARS_INT_TEXT = r"^[\s\x1c-\x1f]*[+-]?\d[\d_]*[\s\x1c-\x1f]*$"
+_INT64_LIMIT = 2**63
+
+
+def _polars_count_column(pl, schema, name: str):
+    """Return a polars expression mirroring ``validate._normalise_int`` for *name*.
+
+    Cells flagged by :func:`_polars_unreadable_count` come out as null here.
+    """
+
+    if name not in schema:
+        return pl.lit(None, dtype=pl.Int64).alias(name)
+    dtype = schema[name]
+    column = pl.col(name)
+    if dtype == pl.Utf8:
+        value = column.str.strip_chars().cast(pl.Int64, strict=False)
+    elif dtype.is_float():
+        # int() truncates towards zero, so -1 < value < 0 still counts as 0.
+        in_range = column.is_finite() & (column > -1) & (column < _INT64_LIMIT)
+        value = pl.when(in_range).then(column).otherwise(None).cast(pl.Int64)
+    elif dtype == pl.UInt64:
+        value = pl.when(column < _INT64_LIMIT).then(column).otherwise(None).cast(pl.Int64)
+    elif dtype.is_integer():
+        value = column.cast(pl.Int64)
+    else:
+        value = pl.lit(None, dtype=pl.Int64)
+    return pl.when(value >= 0).then(value).otherwise(None).alias(name)
+
+
+def _polars_unreadable_count(pl, schema, name: str):
+    """Return a boolean expression flagging *name* cells polars cannot read.
+
+    These are counts ``_normalise_int`` may accept that have no Int64 cast in
+    polars: text matching ``_POLARS_INT_TEXT`` that the cast rejects, and
+    float or unsigned values of 2**63 or more.
+    """
+
+    if name not in schema:
+        return pl.lit(False)
+    dtype = schema[name]
+    column = pl.col(name)
+    if dtype == pl.Utf8:
+        return (
+            column.str.strip_chars().cast(pl.Int64, strict=False).is_null()
+            & column.str.contains(_POLARS_INT_TEXT)
+        )
+    if dtype.is_float() or dtype == pl.UInt64:
+        return (column >= _INT64_LIMIT).fill_null(False)
+    return pl.lit(False)
+
+
+def summarise_path_polars(
+    path: Path,
+    include_results: Iterable[str] | None = None,
+    exclude_results: Iterable[str] | None = None,
 ) -> Summary:
-    """Load records from *path* and return their summary."""
+    """Summarise *path* with a lazy polars query instead of Python loops.
 
-    records = load_records(path)
-    filtered = filter_records(records, include_results, exclude_results)
-    return summarise_records(filtered)
+    Produces the same :class:`Summary` as :func:`summarise_path`; requires the
+    optional ``polars`` package.  A file with counts polars cannot parse the
+    way ``validate._normalise_int`` does, such as ``1_000``, non-ASCII digits
+    or values past the Int64 range, is handed to :func:`summarise_path`.
+    """
+
+    if importlib.util.find_spec("polars") is None:
+        raise DatasetError(
+            f"{path}: The polars engine requires the 'polars' package to be installed"
+        )
+    pl = importlib.import_module("polars")
+
+    suffix = path.suffix.lower()
+    try:
+        if suffix == ".csv":
+            frame = pl.scan_csv(path, infer_schema=False)
+        elif suffix == ".parquet":
+            frame = pl.scan_parquet(path)
+        else:
+            raise DatasetError(f"{path}: Unsupported file extension")
+        schema = frame.collect_schema()
+    except DatasetError:
+        raise
+    except Exception as exc:  # pragma: no cover - depends on polars errors
+        raise DatasetError(f"{path}: Unable to read dataset: {exc}") from exc
+
+    if "result" in schema:
+        result = (
+            pl.col("result").cast(pl.Utf8).str.strip_chars().str.to_lowercase().fill_null("")
+        )
+    else:
+        result = pl.lit("")
+    frame = frame.select(
+        result.alias("result"),
+        _polars_count_column(pl, schema, "moves"),
+        _polars_count_column(pl, schema, "duration_ms"),
+        (
+            _polars_unreadable_count(pl, schema, "moves")
+            | _polars_unreadable_count(pl, schema, "duration_ms")
+        ).alias("unreadable"),
+    )
+
+    include_set = _result_set(include_results)
+    exclude_set = _result_set(exclude_results)
+    if include_set:
+        frame = frame.filter(pl.col("result").is_in(sorted(include_set)))
+    if exclude_set:
+        frame = frame.filter(~pl.col("result").is_in(sorted(exclude_set)))
+
+    is_win = pl.col("result") == "win"
+    counts_query = frame.group_by("result").agg(pl.len().alias("count"))
+    stats_query = frame.select(
+        pl.len().alias("total"),
+        is_win.sum().alias("wins"),
+        pl.col("moves").mean().alias("average_moves"),
+        pl.col("moves").median().alias("median_moves"),
+        pl.col("duration_ms").mean().alias("average_duration_ms"),
+        pl.col("duration_ms").median().alias("median_duration_ms"),
+        pl.col("duration_ms").max().alias("longest_duration_ms"),
+        pl.col("moves").filter(is_win).min().alias("fastest_win_moves"),
+        pl.col("duration_ms").filter(is_win).min().alias("fastest_win_duration_ms"),
+        pl.col("unreadable").any().alias("unreadable"),
+    )
+    try:
+        counts, stats = pl.collect_all([counts_query, stats_query])
+    except Exception as exc:  # pragma: no cover - depends on polars errors
+        raise DatasetError(f"{path}: Unable to read dataset: {exc}") from exc
+
+    row = stats.row(0, named=True)
+    if row["unreadable"]:
+        return summarise_path(path, include_set, exclude_set)
+
+    # Blank results are reported as "unknown", so they share a key with any
+    # literal "unknown" labels.
+    result_counts: dict[str, int] = {}
+    for label, count in counts.iter_rows():
+        key = label or "unknown"
+        result_counts[key] = result_counts.get(key, 0) + int(count)
+    total = int(row["total"])
+    return Summary(
+        total_records=total,
+        result_counts=result_counts,
+        win_rate=int(row["wins"]) / total if total else None,
+        average_moves=row["average_moves"],
+        median_moves=row["median_moves"],
+        average_duration_ms=row["average_duration_ms"],
+        median_duration_ms=row["median_duration_ms"],
+        fastest_win_moves=row["fastest_win_moves"],
+        fastest_win_duration_ms=row["fastest_win_duration_ms"],
+        longest_duration_ms=row["longest_duration_ms"],
+    )
+
+
+ENGINES = {
+    "python": summarise_path,
+    "polars": summarise_path_polars,
+}
 
 
 def run(
     paths: Iterable[str],
     *,
-    include_results: Sequence[str] | None = None,
-    exclude_results: Sequence[str] | None = None,
+    include_results: Iterable[str] | None = None,
+    exclude_results: Iterable[str] | None = None,
+    engine: str = "python",
+    jobs: int = 1,
 ) -> list[tuple[Path, Summary]]:
-    """Compute summaries for each path in *paths*."""
-
-    results: list[tuple[Path, Summary]] = []
-    for raw_path in paths:
-        path = Path(raw_path)
-        summary = summarise_path(path, include_results, exclude_results)
-        results.append((path, summary))
-    return results
+    """Compute summaries for each path in *paths*.
+
+    With ``jobs`` other than 1 the files are summarised in worker processes
+    (``0`` starts one per CPU); results keep the order of *paths*.
+    """
+
+    resolved = [Path(raw_path) for raw_path in paths]
+    # Normalise the filters once per run instead of once per file.
+    summarise = partial(
+        ENGINES[engine],
+        include_results=_result_set(include_results),
+        exclude_results=_result_set(exclude_results),
+    )
+    workers = jobs if jobs > 0 else os.cpu_count() or 1
+    if workers > 1 and len(resolved) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(resolved))) as executor:
+            summaries = list(executor.map(summarise, resolved))
+    else:
+        summaries = [summarise(path) for path in resolved]
+    return list(zip(resolved, summaries))
 
 
 def summary_to_dict(summary: Summary) -> dict[str, object]:
@@ -239,6 +549,18 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Emit the summary as JSON instead of formatted text.",
     )
+    parser.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default="python",
+        help="Aggregation backend. 'polars' requires the optional polars package.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to summarise files in parallel. Use 0 for one per CPU (default: 1).",
+    )
     return parser
 
 
@@ -251,6 +573,8 @@ def main(argv: Sequence[str] | None = None) -> int:
             args.paths,
             include_results=args.include_results,
             exclude_results=args.exclude_results,
+            engine=args.engine,
+            jobs=args.jobs,
         )
     except DatasetError as exc:
         parser.error(str(exc))
@@ -4,24 +4,36 @@
 This utility reads unsized win entries from ``data/wins.parquet`` and assigns
 ``difficulty_score`` plus a categorical ``difficulty_level`` bucket.  It is
 intended to run as a nightly cron job so downstream analytics can rely on the
-labels being populated.
+labels being populated.  Wins queued by the API as individual part files in
+``data/wins/`` are folded into the log on each run.
 """
 from __future__ import annotations
 
 import argparse
+import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Sequence
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 DEFAULT_DATA_PATH = Path("data/wins.parquet")
 DEFAULT_SEED_PATH = Path("data/wins_seed.csv")
 
 LOGGER = logging.getLogger("update_difficulty")
 
+_SELECTION_COLUMNS = ("difficulty_level", "timestamp_utc")
+_SCORING_COLUMNS = ("node_count", "solve_time_ms", "draw_mode")
+_LEVEL_LABELS = np.array(["easy", "medium", "hard"], dtype=object)
+# Parquet footer key listing the pending parts folded into the log by the run
+# that wrote it.
+_FOLDED_PARTS_KEY = b"solitaire.folded_parts"
+
 
 class DifficultyUpdateError(RuntimeError):
     """Raised when the difficulty update job cannot be completed."""
@@ -38,68 +50,186 @@ def _parse_since(value: str | None) -> datetime | None:
         ) from exc
 
 
-def _normalise_level_column(raw: pd.Series) -> pd.Series:
+def _missing_level_mask(raw: pd.Series) -> np.ndarray:
+    """Return a boolean mask of rows whose ``difficulty_level`` is unset.
+
+    Blank and whitespace-only labels count as unset.  String columns are
+    checked in place; only mixed object columns pay for an ``astype(str)``.
+    """
+
+    if pd.api.types.is_string_dtype(raw):
+        stripped = raw.str.strip()
+        return (raw.isna() | stripped.eq("")).to_numpy(dtype=bool)
     if raw.dtype == "O":
-        return raw.fillna("").astype(str).str.strip()
-    return raw
+        return raw.fillna("").astype(str).str.strip().eq("").to_numpy(dtype=bool)
+    return raw.isna().to_numpy(dtype=bool)
 
 
 def _select_candidate_rows(
     frame: pd.DataFrame, since: datetime | None, limit: int | None
 ) -> pd.Index:
     if "difficulty_level" in frame:
-        levels = _normalise_level_column(frame["difficulty_level"])
-        mask = levels.isna() if levels.dtype != "O" else levels.eq("")
+        mask = _missing_level_mask(frame["difficulty_level"])
     else:
         mask = np.ones(len(frame), dtype=bool)
 
     if since is not None and "timestamp_utc" in frame:
-        timestamps = pd.to_datetime(frame["timestamp_utc"], errors="coerce")
-        mask &= timestamps >= np.datetime64(since)
+        timestamps = pd.to_datetime(
+            frame["timestamp_utc"], errors="coerce", utc=True, cache=True
+        )
+        cutoff = pd.Timestamp(since, tz="UTC")
+        mask = mask & (timestamps >= cutoff).to_numpy(dtype=bool)
 
-    candidates = frame[mask]
+    positions = np.flatnonzero(mask)
     if limit is not None:
-        candidates = candidates.head(limit)
-    return candidates.index
+        positions = positions[:limit]
+    return frame.index[positions]
 
 
 def _compute_score(subset: pd.DataFrame) -> pd.Series:
-    node_term = np.log10(subset["node_count"].astype(float) + 1.0)
-    time_term = np.log10(subset["solve_time_ms"].astype(float) + 1.0)
-    return node_term + time_term
+    # log10(n + 1) + log10(t + 1) == log10((n + 1) * (t + 1)); folding the
+    # sum into one product lets the whole score reuse a single buffer.
+    nodes = subset["node_count"].to_numpy(dtype=np.float64)
+    times = subset["solve_time_ms"].to_numpy(dtype=np.float64)
+    score = nodes + 1.0
+    score *= times + 1.0
+    np.log10(score, out=score)
+    return pd.Series(score, index=subset.index)
+
+
+def _assign_levels(working: pd.DataFrame) -> np.ndarray:
+    """Bucket scores against the 30th/70th percentile of each draw mode."""
+
+    grouped = working.groupby("draw_mode", sort=False)["difficulty_score"]
+    p30 = grouped.transform("quantile", 0.30).to_numpy()
+    p70 = grouped.transform("quantile", 0.70).to_numpy()
+    scores = working["difficulty_score"].to_numpy()
+    buckets = np.ones(len(scores), dtype=np.int8)
+    buckets[scores < p30] = 0
+    buckets[scores > p70] = 2
+    return _LEVEL_LABELS[buckets]
+
+
+def _write_column(
+    frame: pd.DataFrame, name: str, positions: np.ndarray, values: pd.Series
+) -> None:
+    """Scatter *values* into ``frame[name]`` at *positions* in one assignment.
+
+    The column is rebuilt as a plain ndarray and swapped in whole, which skips
+    the label alignment and per-call dtype checks of ``frame.loc[...] = ...``.
+    """
+
+    dtype = np.float64 if values.dtype.kind == "f" else object
+    if name in frame:
+        column = frame[name].to_numpy(dtype=dtype, na_value=np.nan, copy=True)
+    else:
+        column = np.full(len(frame), np.nan, dtype=dtype)
+    column[positions] = values.to_numpy(dtype=dtype)
+    frame[name] = column
 
 
-def _assign_levels(group: pd.DataFrame) -> pd.Series:
-    if group.empty:
-        return pd.Series(dtype="object")
+def _load_selection_frame(path: Path) -> pd.DataFrame:
+    """Read just the columns ``_select_candidate_rows`` looks at."""
 
-    scores = group["difficulty_score"]
-    p30 = np.percentile(scores, 30)
-    p70 = np.percentile(scores, 70)
+    parquet = pq.ParquetFile(path)
+    present = set(parquet.schema_arrow.names)
+    columns = [name for name in _SELECTION_COLUMNS if name in present]
+    return parquet.read(columns=columns).to_pandas()
 
-    buckets = np.full(len(group), "medium", dtype=object)
-    buckets[scores < p30] = "easy"
-    buckets[scores > p70] = "hard"
-    return pd.Series(buckets, index=group.index)
 
+def _write_parquet(
+    frame: pd.DataFrame, path: Path, folded_parts: Sequence[Path] = ()
+) -> None:
+    """Write *frame* to *path* atomically with ZSTD-compressed columns.
 
-def _load_frame(path: Path) -> pd.DataFrame:
-    if path.exists():
-        return pd.read_parquet(path)
+    The file is written next to *path* and moved into place with
+    ``os.replace``, so an interrupted run never leaves a truncated log.  The
+    names of *folded_parts* are recorded in the footer by the same write.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_FOLDED_PARTS_KEY] = json.dumps([part.name for part in folded_parts])
+    try:
+        pq.write_table(
+            table.replace_schema_metadata(metadata),
+            tmp_path,
+            compression="zstd",
+            compression_level=3,
+            use_dictionary=True,
+        )
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _folded_part_names(path: Path) -> set[str]:
+    """Return the part names recorded as folded by the run that wrote *path*."""
+
+    if not path.exists():
+        return set()
+    metadata = pq.read_schema(path).metadata or {}
+    return set(json.loads(metadata.get(_FOLDED_PARTS_KEY, b"[]")))
 
-    if DEFAULT_SEED_PATH.exists():
+
+def _pending_parts(path: Path) -> list[Path]:
+    """Return the per-win part files the API queued beside *path*, oldest first.
+
+    A run that died after replacing the log but before deleting its parts
+    leaves them behind; the log's footer names them, so they are deleted
+    here rather than folded in twice.
+    """
+
+    parts = sorted(path.with_suffix("").glob("*.parquet"))
+    folded = _folded_part_names(path) if parts else set()
+    pending = []
+    for part in parts:
+        if part.name in folded:
+            LOGGER.info("Removing %s, already folded into %s", part, path)
+            part.unlink(missing_ok=True)
+        else:
+            pending.append(part)
+    return pending
+
+
+def _load_frame(path: Path, pending: Sequence[Path] = ()) -> pd.DataFrame:
+    frames: list[pd.DataFrame] = []
+    if path.exists():
+        frames.append(pd.read_parquet(path))
+    elif DEFAULT_SEED_PATH.exists():
         LOGGER.info(
             "Primary Parquet log %s missing; hydrating from seed CSV %s",
             path,
             DEFAULT_SEED_PATH,
         )
         seeded = pd.read_csv(DEFAULT_SEED_PATH)
-        seeded.to_parquet(path, index=False)
-        return seeded
+        _write_parquet(seeded, path)
+        frames.append(seeded)
+    elif not pending:
+        raise DifficultyUpdateError(
+            f"Win log not found: {path} (and seed {DEFAULT_SEED_PATH} missing)"
+        )
 
-    raise DifficultyUpdateError(
-        f"Win log not found: {path} (and seed {DEFAULT_SEED_PATH} missing)"
+    if not pending:
+        return frames[0]
+    # Stitch the small parts together in Arrow and convert once, rather than
+    # building and concatenating a DataFrame per part.
+    queued = pa.concat_tables(
+        [pq.read_table(part) for part in pending], promote_options="permissive"
     )
+    LOGGER.info("Folding %s pending wins into %s", queued.num_rows, path)
+    frames.append(queued.to_pandas())
+    return pd.concat(frames, ignore_index=True)
+
+
+def _store_frame(frame: pd.DataFrame, path: Path, pending: Sequence[Path]) -> None:
+    """Write *frame* to *path*, then drop the pending parts it now contains."""
+
+    _write_parquet(frame, path, pending)
+    for part in pending:
+        part.unlink(missing_ok=True)
 
 
 def update_difficulty(
@@ -108,28 +238,39 @@ def update_difficulty(
     since: datetime | None = None,
     limit: int | None = None,
 ) -> tuple[int, dict[str, int]]:
-    frame = _load_frame(path)
+    pending = _pending_parts(path)
+    if path.exists() and not pending:
+        # Nightly runs usually find nothing new; settle that from the two
+        # selection columns before reading and rewriting the whole log.
+        selection = _load_selection_frame(path)
+        if len(selection) and _select_candidate_rows(selection, since, 1).empty:
+            LOGGER.info("No new wins require difficulty scoring")
+            return 0, {}
+
+    frame = _load_frame(path, pending)
     if frame.empty:
         LOGGER.info("No records to process")
         return 0, {}
 
     candidate_index = _select_candidate_rows(frame, since, limit)
     if candidate_index.empty:
+        if pending:
+            _store_frame(frame, path, pending)
         LOGGER.info("No new wins require difficulty scoring")
         return 0, {}
 
-    working = frame.loc[candidate_index].copy()
+    # Only the scoring inputs are gathered for the candidates; the rest of each
+    # row stays in ``frame`` and the results are scattered back by position.
+    positions = frame.index.get_indexer(candidate_index)
+    working = frame[list(_SCORING_COLUMNS)].take(positions)
     working["difficulty_score"] = _compute_score(working)
 
-    grouped = working.groupby("draw_mode", sort=False, group_keys=False)
-    levels = grouped.apply(_assign_levels)
-    working["difficulty_level"] = levels.values
+    working["difficulty_level"] = _assign_levels(working)
 
-    frame.loc[working.index, "difficulty_score"] = working["difficulty_score"]
-    frame.loc[working.index, "difficulty_level"] = working["difficulty_level"]
+    _write_column(frame, "difficulty_score", positions, working["difficulty_score"])
+    _write_column(frame, "difficulty_level", positions, working["difficulty_level"])
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    frame.to_parquet(path, index=False)
+    _store_frame(frame, path, pending)
 
     counts: dict[str, int] = (
         working["difficulty_level"].value_counts().sort_index().to_dict()
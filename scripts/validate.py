@@ -6,20 +6,26 @@ import csv
 import importlib
 import importlib.util
 import math
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Iterator, Mapping, Sequence
+from typing import Callable, Iterable, Iterator, Mapping, Sequence
 
-REQUIRED_COLUMNS = {"tag", "result", "timestamp_utc"}
-RECOMMENDED_COLUMNS = {"seed", "moves", "duration_ms"}
-ALLOWED_RESULTS = {"win", "loss", "abandoned", "unknown"}
+REQUIRED_COLUMNS = frozenset({"tag", "result", "timestamp_utc"})
+RECOMMENDED_COLUMNS = frozenset({"seed", "moves", "duration_ms"})
+ALLOWED_RESULTS = frozenset({"win", "loss", "abandoned", "unknown"})
+
+_PARQUET_BATCH_SIZE = 65_536
 
 
 class DatasetError(Exception):
     """Raised when a fatal dataset issue is encountered."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Record:
     """Normalised dataset record."""
 
@@ -39,16 +45,84 @@ class Record:
         return (self.tag, self.seed, self.timestamp_utc)
 
 
+def _read_csv_table(path: Path, columns: Sequence[str] | None = None):
+    """Parse *path* with pyarrow's multi-threaded CSV reader when possible.
+
+    Every column is read as text, so cell values match ``csv.DictReader``.
+    With *columns*, only those present in the header are converted and kept.
+    Returns ``None`` when pyarrow is not installed or the file needs the
+    stdlib reader's handling (duplicate headers, ragged rows, bad input).
+    """
+
+    if importlib.util.find_spec("pyarrow") is None:
+        return None
+    pa = importlib.import_module("pyarrow")
+    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if not header or len(set(header)) != len(header):
+            return None
+        kept = header if columns is None else [name for name in header if name in columns]
+        if not kept:
+            # pyarrow reads include_columns=[] as "every column", so when none
+            # of *columns* exist only the rows are counted, as the stdlib
+            # reader would yield them.
+            try:
+                rows = sum(1 for row in reader if row)
+            except (csv.Error, UnicodeDecodeError):
+                return None
+            return pa.table({"rows": pa.nulls(rows)}).select([])
+
+    pa_csv = importlib.import_module("pyarrow.csv")
+    try:
+        # Parse straight from the page cache rather than through read calls
+        # into a user-space buffer.
+        with pa.memory_map(str(path), "r") as source:
+            return pa_csv.read_csv(
+                source,
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in kept},
+                    include_columns=kept,
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+    except (pa.ArrowInvalid, UnicodeDecodeError):
+        return None
+
+
 def _load_csv(path: Path) -> Iterator[Mapping[str, object]]:
+    table = _read_csv_table(path)
+    if table is not None:
+        yield from table.to_pylist()
+        return
+
+    yield from _iter_csv_rows(path)
+
+
+def _iter_csv_rows(path: Path) -> Iterator[Mapping[str, object]]:
+    """Yield the rows of *path* as dicts using the stdlib ``csv`` module."""
+
     with path.open("r", encoding="utf-8-sig", newline="") as handle:
-        reader = csv.DictReader(handle)
-        if reader.fieldnames is None:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
             raise DatasetError(f"{path}: Missing header row")
+        # Same rows as csv.DictReader, minus its per-row bookkeeping: blank
+        # lines are skipped, short rows read as None for their missing cells
+        # and cells past the header are dropped.
+        width = len(header)
+        padding = [None] * width
         for row in reader:
-            yield {key: value for key, value in row.items() if key is not None}
+            if not row:
+                continue
+            if len(row) < width:
+                row += padding[len(row):]
+            yield dict(zip(header, row))
 
 
-def _load_parquet(path: Path) -> Iterator[Mapping[str, object]]:
+def _open_parquet(path: Path):
     spec = importlib.util.find_spec("pyarrow")
     if spec is None:
         raise DatasetError(
@@ -56,28 +130,186 @@ def _load_parquet(path: Path) -> Iterator[Mapping[str, object]]:
         )
     parquet_module = importlib.import_module("pyarrow.parquet")
     try:
-        table = parquet_module.read_table(path)
+        return parquet_module.ParquetFile(path)
     except Exception as exc:  # pragma: no cover - depends on pyarrow errors
         raise DatasetError(f"{path}: Unable to read Parquet file: {exc}") from exc
-    for batch in table.to_batches():
-        for row in batch.to_pylist():
-            yield row
 
 
-def load_records(path: Path) -> list[Record]:
-    loaders = {
-        ".csv": _load_csv,
-        ".parquet": _load_parquet,
+def _read_parquet_table(path: Path, columns: Sequence[str] | None = None):
+    parquet_file = _open_parquet(path)
+    if columns is not None:
+        present = set(parquet_file.schema_arrow.names)
+        columns = [name for name in columns if name in present]
+    try:
+        return parquet_file.read(columns=columns)
+    except Exception as exc:  # pragma: no cover - depends on pyarrow errors
+        raise DatasetError(f"{path}: Unable to read Parquet file: {exc}") from exc
+
+
+def _load_parquet(path: Path) -> Iterator[Mapping[str, object]]:
+    # Decode one record batch at a time rather than the whole table, so only
+    # the row dicts themselves grow with the file.
+    parquet_file = _open_parquet(path)
+    try:
+        for batch in parquet_file.iter_batches(batch_size=_PARQUET_BATCH_SIZE):
+            yield from batch.to_pylist()
+    except Exception as exc:  # pragma: no cover - depends on pyarrow errors
+        raise DatasetError(f"{path}: Unable to read Parquet file: {exc}") from exc
+
+
+def _load_csv_columns(path: Path, names: Sequence[str]) -> dict[str, object]:
+    table = _read_csv_table(path, names)
+    if table is not None:
+        return _table_columns(table, names)
+
+    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            raise DatasetError(f"{path}: Missing header row")
+        # Like csv.DictReader: the last duplicate header wins, blank lines are
+        # skipped and short rows read as None for their missing cells.
+        positions = {name: index for index, name in enumerate(header)}
+        rows = [row for row in reader if row]
+
+    columns: dict[str, list[object]] = {}
+    for name in names:
+        index = positions.get(name)
+        if index is None:
+            columns[name] = [None] * len(rows)
+        else:
+            columns[name] = [row[index] if index < len(row) else None for row in rows]
+    return columns
+
+
+def _load_parquet_columns(path: Path, names: Sequence[str]) -> dict[str, object]:
+    return _table_columns(_read_parquet_table(path, names), names)
+
+
+def _table_columns(table, names: Sequence[str]) -> dict[str, object]:
+    # Present columns stay Arrow arrays so load_columns can normalise typed
+    # columns in Arrow compute before converting them to Python objects.
+    return {
+        name: (
+            table.column(name)
+            if name in table.column_names
+            else [None] * table.num_rows
+        )
+        for name in names
     }
+
+
+_LOADERS: dict[str, Callable[[Path], Iterator[Mapping[str, object]]]] = {
+    ".csv": _load_csv,
+    ".parquet": _load_parquet,
+}
+
+_COLUMN_LOADERS: dict[str, Callable[[Path, Sequence[str]], dict[str, object]]] = {
+    ".csv": _load_csv_columns,
+    ".parquet": _load_parquet_columns,
+}
+
+
+def _loader_for(path: Path, loaders: Mapping[str, Callable] = _LOADERS) -> Callable:
     loader = loaders.get(path.suffix.lower())
     if loader is None:
         raise DatasetError(f"{path}: Unsupported file extension")
+    return loader
+
+
+def load_records(path: Path) -> list[Record]:
+    loader = _loader_for(path)
+
+    table = _read_csv_table(path) if loader is _load_csv else None
+    if table is not None:
+        # The parsed CSV is already columnar, so fields are taken from its
+        # columns rather than gathered back out of the row dicts.
+        raws = table.to_pylist()
+        raw_columns = _table_columns(table, tuple(_COLUMN_NORMALISERS))
+    else:
+        # A CSV that pyarrow declined goes straight to the stdlib reader
+        # rather than back through _load_csv, which would parse it again.
+        raws = list(_iter_csv_rows(path) if loader is _load_csv else loader(path))
+        raw_columns = {
+            name: [raw.get(name) for raw in raws] for name in _COLUMN_NORMALISERS
+        }
+    columns = [
+        _normalise_loaded_column(normalise, raw_columns[name])
+        for name, normalise in _COLUMN_NORMALISERS.items()
+    ]
+    # _COLUMN_NORMALISERS lists the Record fields in declaration order.
+    return [Record(*values, raw) for *values, raw in zip(*columns, raws)]
+
+
+def load_columns(
+    path: Path, columns: Sequence[str] | None = None
+) -> dict[str, list[object]]:
+    """Load *path* as one normalised list per :class:`Record` field.
+
+    Only the requested *columns* are normalised, and no :class:`Record`
+    objects are built, which suits aggregate scripts that read a couple of
+    fields from every row.  Values match the corresponding ``Record``
+    attributes.
+    """
+
+    names = tuple(columns) if columns is not None else tuple(_COLUMN_NORMALISERS)
+    unknown = [name for name in names if name not in _COLUMN_NORMALISERS]
+    if unknown:
+        raise ValueError("Unknown record columns: " + ", ".join(unknown))
+    loader = _loader_for(path, _COLUMN_LOADERS)
+
+    raw_columns = loader(path, names)
+    return {
+        name: _normalise_loaded_column(_COLUMN_NORMALISERS[name], raw_columns[name])
+        for name in names
+    }
+
 
-    records = []
-    for raw in loader(path):
-        record = _normalise_record(raw)
-        records.append(record)
-    return records
+def _normalise_loaded_column(
+    normalise: Callable[[object | None], object], column
+) -> list[object]:
+    """Normalise a loaded *column*, either a list or a pyarrow array.
+
+    Integer Arrow columns only need negative counts nulled, which one
+    ``if_else`` kernel does; everything else goes through
+    :func:`_normalise_column`.
+    """
+
+    if isinstance(column, list):
+        return _normalise_column(normalise, column)
+    pa = importlib.import_module("pyarrow")
+    if normalise is _normalise_int and pa.types.is_integer(column.type):
+        if pa.types.is_unsigned_integer(column.type):
+            # Comparing a uint64 column with 0 fails for values past Int64.
+            return column.to_pylist()
+        pc = importlib.import_module("pyarrow.compute")
+        negative = pc.less(column, 0)
+        return pc.if_else(negative, pa.scalar(None, column.type), column).to_pylist()
+    return _normalise_column(normalise, column.to_pylist())
+
+
+def _normalise_column(
+    normalise: Callable[[object | None], object], values: list[object]
+) -> list[object]:
+    """Apply *normalise* to *values*, once per distinct value where that pays.
+
+    Results, counts and durations repeat heavily, so their cells are looked up
+    in a table built from the distinct values.  Loaders yield one type per
+    column (all text for CSV), so equal-hashing values such as ``1`` and
+    ``True`` never share a table entry.  Float columns skip the table: ``0.0``
+    and ``-0.0`` hash equal but normalise to different strings.
+    """
+
+    try:
+        distinct = set(values)
+    except TypeError:  # unhashable cells, e.g. nested Parquet values
+        return list(map(normalise, values))
+    if 2 * len(distinct) > len(values) or any(
+        isinstance(value, float) for value in distinct
+    ):
+        return list(map(normalise, values))
+    table = {value: normalise(value) for value in distinct}
+    return list(map(table.__getitem__, values))
 
 
 def _normalise_string(value: object | None) -> str | None:
@@ -94,6 +326,16 @@ def _normalise_string(value: object | None) -> str | None:
 
 
 def _normalise_int(value: object | None) -> int | None:
+    # Text is checked first: every CSV cell is a string.
+    if isinstance(value, str):
+        stripped = value.strip()
+        if not stripped:
+            return None
+        try:
+            candidate = int(stripped, 10)
+        except ValueError:
+            return None
+        return candidate if candidate >= 0 else None
     if value is None:
         return None
     if isinstance(value, bool):
@@ -105,36 +347,31 @@ def _normalise_int(value: object | None) -> int | None:
             return None
         candidate = int(value)
         return candidate if candidate >= 0 else None
-    if isinstance(value, str):
-        stripped = value.strip()
-        if not stripped:
-            return None
-        try:
-            candidate = int(stripped, 10)
-        except ValueError:
-            return None
-        return candidate if candidate >= 0 else None
     return None
 
 
-def _normalise_record(raw: Mapping[str, object]) -> Record:
-    tag = _normalise_string(raw.get("tag")) or ""
-    result = (_normalise_string(raw.get("result")) or "").lower()
-    timestamp = _normalise_string(raw.get("timestamp_utc")) or ""
-
-    return Record(
-        tag=tag,
-        result=result,
-        timestamp_utc=timestamp,
-        seed=_normalise_string(raw.get("seed")),
-        moves=_normalise_int(raw.get("moves")),
-        duration_ms=_normalise_int(raw.get("duration_ms")),
-        notes=_normalise_string(raw.get("notes")),
-        raw=raw,
-    )
+def _normalise_required_string(value: object | None) -> str:
+    return _normalise_string(value) or ""
+
+
+def _normalise_result(value: object | None) -> str:
+    # Result labels repeat across every row; interning keeps one copy of each
+    # and lets downstream comparisons short-circuit on identity.
+    return sys.intern((_normalise_string(value) or "").lower())
 
 
-@dataclass
+_COLUMN_NORMALISERS: dict[str, Callable[[object | None], object]] = {
+    "tag": _normalise_required_string,
+    "result": _normalise_result,
+    "timestamp_utc": _normalise_required_string,
+    "seed": _normalise_string,
+    "moves": _normalise_int,
+    "duration_ms": _normalise_int,
+    "notes": _normalise_string,
+}
+
+
+@dataclass(slots=True)
 class ValidationResult:
     path: Path
     records: list[Record]
@@ -147,10 +384,7 @@ class ValidationResult:
 
     @property
     def result_counts(self) -> Mapping[str, int]:
-        counts: dict[str, int] = {}
-        for record in self.records:
-            counts[record.result] = counts.get(record.result, 0) + 1
-        return counts
+        return Counter(record.result for record in self.records)
 
 
 def validate_records(path: Path, records: Sequence[Record]) -> ValidationResult:
@@ -160,49 +394,61 @@ def validate_records(path: Path, records: Sequence[Record]) -> ValidationResult:
         return result
 
     header = {key.lower() for key in records[0].raw.keys()}
-    missing_columns = [column for column in REQUIRED_COLUMNS if column not in header]
+    missing_columns = REQUIRED_COLUMNS.difference(header)
     if missing_columns:
         result.errors.append(
             "Missing required columns: " + ", ".join(sorted(missing_columns))
         )
 
-    missing_recommended = [
-        column for column in RECOMMENDED_COLUMNS if column not in header
-    ]
+    missing_recommended = RECOMMENDED_COLUMNS.difference(header)
     if missing_recommended:
         result.warnings.append(
             "Missing recommended columns: " + ", ".join(sorted(missing_recommended))
         )
 
-    invalid_results = [
-        record
-        for record in records
-        if record.result and record.result not in ALLOWED_RESULTS
-    ]
-    if invalid_results:
-        unique_values = sorted({record.result for record in invalid_results})
+    # One pass gathers everything the per-record checks below report on.
+    invalid_values: set[str] = set()
+    distinct_results: set[str] = set()
+    empty_tags = 0
+    empty_timestamps = 0
+    identities = []
+    for record in records:
+        value = record.result
+        if value:
+            distinct_results.add(value)
+            if value not in ALLOWED_RESULTS:
+                invalid_values.add(value)
+        if not record.tag:
+            empty_tags += 1
+        if not record.timestamp_utc:
+            empty_timestamps += 1
+        identities.append(record.identity)
+
+    if invalid_values:
         result.errors.append(
-            "Unexpected result values: " + ", ".join(unique_values)
+            "Unexpected result values: " + ", ".join(sorted(invalid_values))
         )
 
-    empty_tags = [record for record in records if not record.tag]
     if empty_tags:
-        result.errors.append(f"{len(empty_tags)} records missing tag values")
+        result.errors.append(f"{empty_tags} records missing tag values")
 
-    empty_timestamps = [record for record in records if not record.timestamp_utc]
     if empty_timestamps:
         result.errors.append(
-            f"{len(empty_timestamps)} records missing timestamp_utc values"
+            f"{empty_timestamps} records missing timestamp_utc values"
         )
 
-    duplicate_keys: dict[tuple[str, str | None, str], int] = {}
     duplicates = []
-    for record in records:
-        key = record.identity
-        count = duplicate_keys.get(key, 0) + 1
-        duplicate_keys[key] = count
-        if count == 2:
-            duplicates.append(key)
+    # Most logs have no duplicates; a set settles that in one C-level pass and
+    # the ordered scan below only runs when there is something to report.
+    if len(set(identities)) != len(identities):
+        seen: set[tuple[str, str | None, str]] = set()
+        reported: set[tuple[str, str | None, str]] = set()
+        for key in identities:
+            if key not in seen:
+                seen.add(key)
+            elif key not in reported:
+                reported.add(key)
+                duplicates.append(key)
     if duplicates:
         formatted = ", ".join(
             f"(tag={tag}, seed={seed or '—'}, timestamp_utc={timestamp})"
@@ -210,8 +456,7 @@ def validate_records(path: Path, records: Sequence[Record]) -> ValidationResult:
         )
         result.errors.append(f"Duplicate records detected: {formatted}")
 
-    result_only_values = [record.result for record in records if record.result]
-    if result_only_values and len(set(result_only_values)) == 1:
+    if len(distinct_results) == 1:
         result.warnings.append(
             "All records share the same result value; outcome coverage may be incomplete"
         )
@@ -227,14 +472,25 @@ def format_result(result: ValidationResult) -> str:
     return f"{result.path}: {status} ({len(result.records)} rows) {counts}".strip()
 
 
+def validate_path(path: Path) -> ValidationResult:
+    """Load *path* and return its validation result."""
+
+    return validate_records(path, load_records(path))
+
+
 def run(paths: Iterable[str]) -> list[ValidationResult]:
-    results: list[ValidationResult] = []
-    for raw_path in paths:
-        path = Path(raw_path)
-        records = load_records(path)
-        validation = validate_records(path, records)
-        results.append(validation)
-    return results
+    return [validate_path(Path(raw_path)) for raw_path in paths]
+
+
+def _report_path(path: Path) -> tuple[str, list[str], list[str]]:
+    """Validate *path* and return its status line, warnings and errors.
+
+    Worker processes send back only this report: pickling a full
+    :class:`ValidationResult` with every record costs more than validating.
+    """
+
+    result = validate_path(path)
+    return format_result(result), result.warnings, result.errors
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -246,6 +502,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
         nargs="+",
         help="Paths to dataset files. Use shell globs to validate multiple files at once.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to validate files in parallel. Use 0 for one per CPU (default: 1).",
+    )
     return parser
 
 
@@ -253,17 +515,23 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser = build_arg_parser()
     args = parser.parse_args(argv)
 
+    paths = [Path(raw_path) for raw_path in args.paths]
+    workers = args.jobs if args.jobs > 0 else os.cpu_count() or 1
     try:
-        results = run(args.paths)
+        if workers > 1 and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+                reports = list(executor.map(_report_path, paths))
+        else:
+            reports = [_report_path(path) for path in paths]
     except DatasetError as exc:
         parser.error(str(exc))
 
     has_error = False
-    for result in results:
-        print(format_result(result))
-        for warning in result.warnings:
+    for status, warnings, errors in reports:
+        print(status)
+        for warning in warnings:
             print(f"  warning: {warning}")
-        for error in result.errors:
+        for error in errors:
             print(f"  error: {error}")
             has_error = True
     return 1 if has_error else 0
@@ -1,15 +1,23 @@
 """Minimal Flask API for ingesting solitaire wins and exposing summaries."""
 from __future__ import annotations
 
+import os
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
+from uuid import uuid4
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from flask import Flask, jsonify, request
 
 DATA_DIR = Path("data")
 WINS_PATH = DATA_DIR / "wins.parquet"
+# Wins ingested since the last nightly run, one small Parquet file each.  The
+# update_difficulty job folds them into WINS_PATH and removes them.
+PENDING_WINS_DIR = DATA_DIR / "wins"
 SUMMARY_PATH = DATA_DIR / "deck_summary.parquet"
 
 REQUIRED_FIELDS = {
@@ -30,32 +38,57 @@ OPTIONAL_FIELDS = {
 app = Flask(__name__)
 
 
-def _load_wins_frame() -> pd.DataFrame:
-    if WINS_PATH.exists():
-        return pd.read_parquet(WINS_PATH)
-    return pd.DataFrame(columns=list(REQUIRED_FIELDS) + list(OPTIONAL_FIELDS))
+def _write_pending_wins(records: List[Dict[str, Any]]) -> Path:
+    """Persist *records* as one part file under ``PENDING_WINS_DIR``.
 
+    Each request writes only its own rows, so ingest cost stays constant as
+    the win log grows.  Part names sort in arrival order, and the file is
+    renamed into place so readers never observe a partial write.
+    """
 
-def _load_summary_frame() -> pd.DataFrame:
-    if SUMMARY_PATH.exists():
-        return pd.read_parquet(SUMMARY_PATH)
-    return pd.DataFrame(
-        columns=[
-            "deck_key",
-            "draw_mode",
-            "median_nodes",
-            "median_time",
-            "median_difficulty",
-            "difficulty_level",
-        ]
-    )
+    PENDING_WINS_DIR.mkdir(parents=True, exist_ok=True)
+    part = PENDING_WINS_DIR / f"{time.time_ns():020d}-{uuid4().hex}.parquet"
+    tmp_part = part.with_name(part.name + ".tmp")
+    pq.write_table(pa.Table.from_pylist(records), tmp_part)
+    os.replace(tmp_part, part)
+    return part
+
+
+def _load_deck_summaries(deck_key: str) -> list[Dict[str, Any]] | None:
+    """Return the summary rows for *deck_key*, or ``None`` if no summary exists."""
+
+    try:
+        mtime_ns = SUMMARY_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    summaries = _read_deck_summaries(deck_key, mtime_ns)
+    return None if summaries is None else list(summaries)
+
+
+@lru_cache(maxsize=1024)
+def _read_deck_summaries(
+    deck_key: str, mtime_ns: int
+) -> tuple[Dict[str, Any], ...] | None:
+    """Read the summary rows for *deck_key* from ``SUMMARY_PATH``.
+
+    *mtime_ns* only keys the cache: once the nightly job rewrites the summary,
+    entries for the old file are never looked up again and age out.  The
+    deck_key predicate is pushed down to the Parquet reader, which skips row
+    groups whose statistics rule the key out instead of loading every deck.
+    """
+
+    if pq.read_metadata(SUMMARY_PATH).num_rows == 0:
+        return None
+    table = pq.read_table(SUMMARY_PATH, filters=[("deck_key", "==", deck_key)])
+    return tuple(table.to_pylist())
 
 
 def _normalise_timestamp(candidate: str | None) -> str:
     if not candidate:
         return datetime.now(timezone.utc).isoformat()
     try:
-        timestamp = datetime.fromisoformat(candidate.replace("Z", "+00:00"))
+        # Python 3.11's fromisoformat reads a trailing "Z" as UTC itself.
+        timestamp = datetime.fromisoformat(candidate)
     except ValueError as exc:
         raise ValueError("timestamp_utc must be ISO-8601 formatted") from exc
     return timestamp.astimezone(timezone.utc).isoformat()
@@ -94,27 +127,43 @@ def ingest_win():
         response = {"error": str(exc)}
         return jsonify(response), 400
 
-    frame = _load_wins_frame()
-    frame = pd.concat([frame, pd.DataFrame([record])], ignore_index=True)
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    frame.to_parquet(WINS_PATH, index=False)
+    _write_pending_wins([record])
 
     return jsonify({"status": "accepted"}), 201
 
 
+@app.post("/api/wins")
+def ingest_wins():
+    payload = request.get_json(silent=True) or {}
+    entries = payload.get("records") if isinstance(payload, dict) else None
+    if not isinstance(entries, list) or not entries:
+        return jsonify({"error": "records must be a non-empty list"}), 400
+
+    records = []
+    for index, entry in enumerate(entries):
+        try:
+            if not isinstance(entry, dict):
+                raise ValueError("record must be an object")
+            records.append(_validate_payload(entry))
+        except ValueError as exc:
+            return jsonify({"error": f"records[{index}]: {exc}"}), 400
+
+    # One part file for the whole batch, so the Parquet write and the nightly
+    # fold are paid per request rather than per win.
+    _write_pending_wins(records)
+
+    return jsonify({"status": "accepted", "count": len(records)}), 201
+
+
 @app.get("/api/deck/<deck_key>")
 def get_deck_summary(deck_key: str):
-    frame = _load_summary_frame()
-    if frame.empty:
+    summaries = _load_deck_summaries(deck_key)
+    if summaries is None:
         return jsonify({"error": "deck summary unavailable"}), 404
-
-    subset = frame[frame["deck_key"] == deck_key]
-    if subset.empty:
+    if not summaries:
         return jsonify({"error": "deck not found"}), 404
 
-    # Convert to native Python types for JSON serialisation.
-    result = subset.to_dict(orient="records")
-    return jsonify({"deck_key": deck_key, "summaries": result})
+    return jsonify({"deck_key": deck_key, "summaries": summaries})
 
 
 if __name__ == "__main__":  # pragma: no cover - manual execution helper
@@ -40,3 +40,7 @@ LEFT JOIN thresholds AS t USING (draw_mode);
 
 CREATE INDEX IF NOT EXISTS idx_deck_summary_deck_key ON deck_summary(deck_key);
 CREATE INDEX IF NOT EXISTS idx_deck_summary_draw_mode ON deck_summary(draw_mode);
+
+-- Sorted, bounded row groups let the API prune by deck_key min/max statistics.
+COPY (SELECT * FROM deck_summary ORDER BY deck_key, draw_mode)
+    TO 'data/deck_summary.parquet' (FORMAT PARQUET, ROW_GROUP_SIZE 10000);
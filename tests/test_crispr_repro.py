@@ -7,15 +7,10 @@ DECK_KEY_SIZE = 32
 def decode_deck_key(payload: bytes) -> list[int]:
     if len(payload) != DECK_KEY_SIZE:
         raise ValueError("Deck key must contain 32 bytes")
-    value = 0
-    for byte in payload:
-        value = (value << 8) | byte
+    value = int.from_bytes(payload, "big")
     digits = [0] * CARD_TOTAL
     for index in range(CARD_TOTAL - 1, -1, -1):
-        base = index + 1
-        digit = value % base
-        value //= base
-        digits[index] = int(digit)
+        value, digits[index] = divmod(value, index + 1)
     if value:
         raise ValueError("Deck key contains leftover data")
     available = list(range(CARD_TOTAL))
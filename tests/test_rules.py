@@ -166,3 +166,84 @@ def test_invalid_pass_limits_raise(value, expected_exception):
     profile = _make_profile(value)
     with pytest.raises(expected_exception):
         _ = profile.pass_limit
+
+
+def test_attribute_based_moves_and_states_are_supported():
+    from types import SimpleNamespace
+
+    state = SimpleNamespace(passes_made=3)
+    assert not STANDARD.is_move_legal(state, SimpleNamespace(type="stock_pass"))
+    assert STANDARD.is_move_legal(
+        SimpleNamespace(passes_made=1), SimpleNamespace(action="STOCK_PASS")
+    )
+    assert STANDARD.passes_remaining(SimpleNamespace(stock_passes=2)) == 1
+
+
+def test_to_dict_returns_independent_copies():
+    first = STANDARD.to_dict()
+    first["draw"] = 99
+    assert STANDARD.to_dict()["draw"] == 3
+    assert json.loads(STANDARD.to_json()) == STANDARD.to_dict()
+
+
+@pytest.mark.parametrize("profile", [MAX_RELAX, FRIENDLY_APP, STANDARD, XRAY])
+def test_deserialised_profiles_are_cached(profile):
+    payload = profile.to_json()
+    assert RuleProfile.from_json(payload) is RuleProfile.from_json(payload)
+    assert RuleProfile.from_dict(profile.to_dict()) is RuleProfile.from_dict(
+        profile.to_dict()
+    )
+
+
+def test_from_dict_cache_distinguishes_value_types():
+    as_int = RuleProfile.from_dict({**STANDARD.to_dict(), "passes": 3})
+    as_float = RuleProfile.from_dict({**STANDARD.to_dict(), "passes": 3.0})
+    assert isinstance(as_int.passes, int)
+    assert isinstance(as_float.passes, float)
+
+
+def test_from_dict_accepts_unhashable_values():
+    profile = RuleProfile.from_dict({**STANDARD.to_dict(), "passes": ["three"]})
+    assert profile.passes == ["three"]
+
+
+def test_profiles_are_slotted_and_hash_consistently():
+    import pickle
+
+    assert not hasattr(STANDARD, "__dict__")
+    restored = pickle.loads(pickle.dumps(STANDARD))
+    assert restored == STANDARD
+    assert hash(restored) == hash(STANDARD)
+    assert {STANDARD: "standard"}[RuleProfile.from_json(STANDARD.to_json())] == "standard"
+
+
+@pytest.mark.parametrize("profile", [MAX_RELAX, FRIENDLY_APP, STANDARD, XRAY])
+def test_compiled_checker_matches_is_move_legal(profile):
+    checker = profile.compile_legality_checker()
+    assert checker is profile.compile_legality_checker()
+
+    moves = [
+        {"type": "draw"},
+        {"type": "draw", "draw_count": 1},
+        {"type": "draw", "draw_count": 3},
+        {"type": "stock_pass"},
+        {"type": "supermove", "strength": "relaxed"},
+        {"type": "supermove", "mode": "standard"},
+        {"type": "foundation_to_tableau"},
+        {"type": "Peek"},
+        {"type": "autoplay", "is_safe": False},
+        {"type": "autoplay", "is_safe": True},
+        {"type": "undo"},
+        {"action": "custom"},
+    ]
+    states = [{}, {"passes_made": 3, "undo_remaining": 0}, {"undo_used": 1}]
+    for state in states:
+        for move in moves:
+            assert checker(state, move) == profile.is_move_legal(state, move)
+
+
+def test_compiled_checker_defers_invalid_pass_limit_errors():
+    checker = _make_profile("bogus").compile_legality_checker()
+    assert checker({}, {"type": "peek"}) is False
+    with pytest.raises(ValueError):
+        checker({}, {"type": "stock_pass"})
@@ -1,6 +1,6 @@
 import math
 
-from scripts.solver import Card, KlondikeSolver
+from scripts.solver import Card, KlondikeSolver, run_cli
 
 
 def test_solver_initialises_tableau_with_correct_counts():
@@ -39,3 +39,42 @@ def test_custom_deck_support_allows_controlled_state():
     # Promote anything that can move to the foundations.
     solver.resolve_forced_moves()
     assert solver.foundation_count() >= 1
+
+
+def test_card_ids_round_trip_through_card_views():
+    for card_id in range(52):
+        assert Card.from_id(card_id).card_id == card_id
+
+    solver = KlondikeSolver(draw_count=3, shuffle_seed=99)
+    dealt = [card.card_id for column in solver.tableau for card in column]
+    dealt += [card.card_id for card in solver.stock]
+    assert sorted(dealt) == list(range(52))
+    assert [sum(card.face_up for card in column) for column in solver.tableau] == [1] * 7
+
+
+def test_card_labels_use_face_card_letters():
+    labels = [Card(rank=rank, suit="spades").label() for rank in range(1, 14)]
+    assert labels == ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+
+
+def test_face_up_cards_stay_a_suffix_of_each_column():
+    solver = KlondikeSolver(draw_count=1, shuffle_seed=2024)
+    for _ in range(300):
+        if not solver.resolve_forced_moves() and not solver.draw_from_stock():
+            if not solver.recycle_stock():
+                break
+        for column in solver.tableau:
+            flags = [card.face_up for card in column]
+            assert flags == sorted(flags)
+            assert not column or column[-1].face_up
+
+
+def test_run_cli_with_jobs_matches_single_process_output(capsys):
+    arguments = ["--seed", "7", "--games", "12", "--max-steps", "500"]
+
+    run_cli(arguments)
+    sequential = capsys.readouterr().out
+
+    run_cli([*arguments, "--jobs", "2"])
+    assert capsys.readouterr().out == sequential
+    assert sequential.count("Game ") == 12
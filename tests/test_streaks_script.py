@@ -7,6 +7,7 @@ from scripts.streaks import (
     compute_streak_summary,
     format_streak_summary,
     main,
+    run,
 )
 from scripts.validate import Record
 
@@ -66,6 +67,22 @@ def test_compute_streak_summary_can_treat_abandoned_as_loss():
     assert summary.current_streak_length == 3
 
 
+def test_compute_streak_summary_resets_current_streak_on_untracked_result():
+    records = [
+        build_record(result="loss"),
+        build_record(result="Win"),
+        build_record(result="win"),
+        build_record(result="abandoned"),
+    ]
+
+    summary = compute_streak_summary(records)
+
+    assert summary.longest_win_streak == 2
+    assert summary.longest_loss_streak == 1
+    assert summary.current_streak_result is None
+    assert summary.current_streak_length == 0
+
+
 def test_format_streak_summary_includes_current_streak(tmp_path: Path):
     summary = StreakSummary(
         total_records=5,
@@ -122,3 +139,20 @@ def test_main_treats_abandoned_as_losses_when_requested(
     assert exit_code == 0
     assert "losses=3" in captured.out
     assert "longest loss streak: 3" in captured.out
+
+
+def test_run_with_jobs_matches_sequential_run(tmp_path: Path):
+    paths = []
+    for index, result in enumerate(("win", "loss", "abandoned")):
+        csv_path = tmp_path / f"sample-{index}.csv"
+        csv_path.write_text(
+            "tag,result,timestamp_utc\n"
+            f"hand-1,{result},2023-01-01T00:00:00Z\n"
+            "hand-2,loss,2023-01-02T00:00:00Z\n",
+            encoding="utf-8",
+        )
+        paths.append(str(csv_path))
+
+    assert run(paths, abandoned_as_loss=True, jobs=2) == run(
+        paths, abandoned_as_loss=True
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
@@ -9,11 +10,13 @@ from scripts.summary import (
     filter_records,
     format_summary,
     main,
+    run,
+    summarise_columns,
     summarise_path,
     summarise_records,
     summary_to_dict,
 )
-from scripts.validate import Record
+from scripts.validate import DatasetError, Record
 
 
 def build_record(**overrides):
@@ -107,6 +110,31 @@ def test_summarise_path_applies_filters(tmp_path: Path):
     assert summary.result_counts == {"win": 1}
 
 
+def test_summarise_path_rereads_rewritten_file(tmp_path: Path):
+    csv_path = tmp_path / "attempts.csv"
+    csv_path.write_text(
+        "tag,result,timestamp_utc\nhand-1,win,2023-01-01T00:00:00Z\n",
+        encoding="utf-8",
+    )
+    first = summarise_path(csv_path)
+    first.result_counts["win"] = 99
+    assert summarise_path(csv_path).result_counts == {"win": 1}
+
+    csv_path.write_text(
+        "tag,result,timestamp_utc\n"
+        "hand-1,win,2023-01-01T00:00:00Z\n"
+        "hand-2,loss,2023-01-02T00:00:00Z\n",
+        encoding="utf-8",
+    )
+    assert summarise_path(csv_path).total_records == 2
+    assert summarise_path(csv_path, exclude_results=["loss"]).total_records == 1
+
+
+def test_summarise_path_reports_missing_unsupported_file(tmp_path: Path):
+    with pytest.raises(DatasetError, match="Unsupported file extension"):
+        summarise_path(tmp_path / "missing.txt")
+
+
 def test_summary_to_dict_orders_result_counts():
     summary = Summary(
         total_records=2,
@@ -159,3 +187,131 @@ def test_main_supports_json_output(tmp_path: Path, capsys: pytest.CaptureFixture
     assert "\"path\"" in captured.out
     assert "\"summary\"" in captured.out
 
+
+def test_json_output_escapes_paths_and_keeps_large_durations(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    csv_path = tmp_path / "café.csv"
+    csv_path.write_text(
+        "tag,result,timestamp_utc,moves,duration_ms\n"
+        "hand-1,win,2023-01-01T00:00:00Z,120,99999999999999999999999\n",
+        encoding="utf-8",
+    )
+
+    exit_code = main(["--json", str(csv_path)])
+    output = capsys.readouterr().out
+
+    assert exit_code == 0
+    assert "caf\\u00e9.csv" in output
+    payload = json.loads(output)
+    assert payload[0]["path"] == str(csv_path)
+    assert payload[0]["summary"]["longest_duration_ms"] == 99999999999999999999999
+
+
+def test_large_columns_match_with_and_without_numpy(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("numpy")
+    import importlib.util
+
+    count = 5000
+    results = ["win" if index % 3 else "loss" for index in range(count)]
+    moves = [None if index % 7 == 0 else (index * 37) % 401 for index in range(count)]
+    durations = [(index * 7919) % 100_003 for index in range(count)]
+    durations[10] = 2**70
+
+    with_numpy = summarise_columns(results, list(moves), list(durations))
+
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "numpy" else real_find_spec(name, *args),
+    )
+
+    assert summarise_columns(results, list(moves), list(durations)) == with_numpy
+    assert with_numpy.longest_duration_ms == 2**70
+    assert type(with_numpy.median_moves) in (int, float)
+
+
+def test_run_with_jobs_matches_sequential_run(tmp_path: Path):
+    paths = []
+    for index, result in enumerate(("win", "loss", "abandoned")):
+        csv_path = tmp_path / f"sample-{index}.csv"
+        csv_path.write_text(
+            "tag,result,timestamp_utc,moves,duration_ms\n"
+            f"hand-1,{result},2023-01-01T00:00:00Z,120,90000\n"
+            "hand-2,win,2023-01-02T00:00:00Z,100,80000\n",
+            encoding="utf-8",
+        )
+        paths.append(str(csv_path))
+
+    assert run(paths, jobs=2, exclude_results=["abandoned"]) == run(
+        paths, exclude_results=["abandoned"]
+    )
+
+
+def test_polars_engine_matches_python_engine(tmp_path: Path):
+    pytest.importorskip("polars")
+    from scripts.summary import summarise_path_polars
+
+    csv_path = tmp_path / "attempts.csv"
+    csv_path.write_text(
+        "tag,result,timestamp_utc,moves,duration_ms\n"
+        "hand-1, Win ,2023-01-01T00:00:00Z,120,90000\n"
+        "hand-2,loss,2023-01-02T00:00:00Z,100,\n"
+        "hand-3,,2023-01-03T00:00:00Z,-4,70000\n"
+        "hand-4,win,2023-01-04T00:00:00Z,bogus,60000\n"
+        "hand-5,unknown,2023-01-05T00:00:00Z,90,50000\n",
+        encoding="utf-8",
+    )
+
+    for include, exclude in [(None, None), (["win"], None), (None, ["loss"])]:
+        expected = summarise_path(csv_path, include, exclude)
+        actual = summarise_path_polars(csv_path, include, exclude)
+        assert actual.total_records == expected.total_records
+        assert actual.result_counts == expected.result_counts
+        for field in (
+            "win_rate",
+            "average_moves",
+            "median_moves",
+            "average_duration_ms",
+            "median_duration_ms",
+            "fastest_win_moves",
+            "fastest_win_duration_ms",
+            "longest_duration_ms",
+        ):
+            assert getattr(actual, field) == pytest.approx(getattr(expected, field))
+
+
+def test_polars_engine_reads_counts_polars_cannot_cast(tmp_path: Path):
+    pytest.importorskip("polars")
+    from scripts.summary import summarise_path_polars
+
+    csv_path = tmp_path / "attempts.csv"
+    csv_path.write_text(
+        "tag,result,timestamp_utc,moves,duration_ms\n"
+        "hand-1,win,2023-01-01T00:00:00Z,1_000,99999999999999999999999\n"
+        "hand-2,loss,2023-01-02T00:00:00Z,\u0663,\x1c5\n",
+        encoding="utf-8",
+    )
+
+    expected = summarise_path(csv_path)
+    assert expected.average_moves == 501.5
+    assert summarise_path_polars(csv_path) == expected
+
+
+def test_polars_engine_requires_polars(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    import importlib.util
+
+    csv_path = tmp_path / "attempts.csv"
+    csv_path.write_text("tag,result,timestamp_utc\nhand-1,win,2023-01-01T00:00:00Z\n")
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "polars" else real_find_spec(name, *args),
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        main(["--engine", "polars", str(csv_path)])
+
+    assert exc.value.code == 2
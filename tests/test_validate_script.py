@@ -149,3 +149,195 @@ def test_parquet_without_pyarrow(tmp_path):
         validate.main([str(parquet_path)])
 
     assert exc.value.code == 2
+
+
+def test_load_columns_matches_record_attributes(tmp_path):
+    csv_path = tmp_path / "columns.csv"
+    _write_csv(
+        csv_path,
+        [
+            {"tag": " eta ", "result": "WIN", "timestamp_utc": "2024-01-06T00:00:00Z", "moves": "12"},
+            {"tag": "theta", "result": "", "timestamp_utc": "2024-01-07T00:00:00Z", "moves": "x"},
+        ],
+    )
+
+    records = validate.load_records(csv_path)
+    columns = validate.load_columns(csv_path, ("tag", "result", "moves"))
+
+    assert list(columns) == ["tag", "result", "moves"]
+    assert columns["tag"] == [record.tag for record in records] == ["eta", "theta"]
+    assert columns["result"] == [record.result for record in records] == ["win", ""]
+    assert columns["moves"] == [record.moves for record in records] == [12, None]
+
+    with pytest.raises(ValueError):
+        validate.load_columns(csv_path, ("bogus",))
+
+
+def test_load_columns_handles_ragged_csv_rows(tmp_path):
+    csv_path = tmp_path / "ragged.csv"
+    csv_path.write_text(
+        "tag,result,moves,result\n"
+        "iota,loss,5,win\n"
+        "\n"
+        "kappa,loss\n",
+        encoding="utf-8",
+    )
+
+    columns = validate.load_columns(csv_path, ("result", "moves", "duration_ms"))
+    records = validate.load_records(csv_path)
+
+    assert columns["result"] == [record.result for record in records] == ["win", ""]
+    assert columns["moves"] == [record.moves for record in records] == [5, None]
+    assert columns["duration_ms"] == [None, None]
+
+
+def test_load_columns_reads_parquet_projection(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    parquet_path = tmp_path / "columns.parquet"
+    parquet.write_table(
+        pa.table({"tag": ["mu", "nu"], "result": [" Loss", None], "moves": [3, -1]}),
+        parquet_path,
+    )
+
+    columns = validate.load_columns(parquet_path, ("result", "moves", "duration_ms"))
+    records = validate.load_records(parquet_path)
+
+    assert columns["result"] == [record.result for record in records] == ["loss", ""]
+    assert columns["moves"] == [record.moves for record in records] == [3, None]
+    assert columns["duration_ms"] == [None, None]
+
+
+def test_load_columns_normalises_typed_parquet_counts(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    parquet_path = tmp_path / "typed.parquet"
+    parquet.write_table(
+        pa.table(
+            {
+                "tag": ["pi", "rho", "sigma"],
+                "result": ["win", "loss", "win"],
+                "moves": pa.array([-2, None, 40], pa.int8()),
+                "duration_ms": pa.array([True, False, None]),
+            }
+        ),
+        parquet_path,
+    )
+
+    columns = validate.load_columns(parquet_path, ("moves", "duration_ms"))
+    records = validate.load_records(parquet_path)
+
+    assert columns["moves"] == [record.moves for record in records] == [None, None, 40]
+    assert columns["duration_ms"] == [record.duration_ms for record in records]
+    assert columns["duration_ms"] == [None, None, None]
+
+
+def test_load_columns_reads_unsigned_parquet_counts(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    parquet_path = tmp_path / "unsigned.parquet"
+    parquet.write_table(
+        pa.table({"moves": pa.array([2**64 - 1, None, 7], pa.uint64())}),
+        parquet_path,
+    )
+
+    columns = validate.load_columns(parquet_path, ("moves",))
+
+    assert columns["moves"] == [2**64 - 1, None, 7]
+
+
+def test_load_columns_keeps_signed_zero_float_seeds(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    parquet_path = tmp_path / "seeds.parquet"
+    parquet.write_table(
+        pa.table({"tag": ["a", "b", "c", "d"], "seed": [0.0, -0.0, 0.0, -0.0]}),
+        parquet_path,
+    )
+
+    columns = validate.load_columns(parquet_path, ("seed",))
+    records = validate.load_records(parquet_path)
+
+    assert columns["seed"] == [record.seed for record in records]
+    assert columns["seed"] == ["0.0", "-0.0", "0.0", "-0.0"]
+
+
+def test_pyarrow_csv_reader_matches_stdlib_reader(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    import importlib.util
+
+    csv_path = tmp_path / "quoted.csv"
+    csv_path.write_text(
+        "﻿tag,result,timestamp_utc,seed,notes\n"
+        'xi,win,2024-01-08T00:00:00Z,007,"multi\nline, note"\n'
+        "omicron,NA,2024-01-09T00:00:00Z,,null\n",
+        encoding="utf-8",
+    )
+
+    assert validate._read_csv_table(csv_path) is not None
+    with_pyarrow = list(validate._load_csv(csv_path))
+
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "pyarrow" else real_find_spec(name, *args),
+    )
+
+    assert list(validate._load_csv(csv_path)) == with_pyarrow
+    assert with_pyarrow[0]["seed"] == "007"
+    assert with_pyarrow[1]["result"] == "NA"
+
+
+def test_csv_column_loads_parse_only_requested_columns(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    csv_path = tmp_path / "wide.csv"
+    csv_path.write_text(
+        "tag,result,timestamp_utc,moves,notes\n"
+        "pi,win,2024-01-10T00:00:00Z,12,long free text\n",
+        encoding="utf-8",
+    )
+
+    table = validate._read_csv_table(csv_path, ("result", "moves", "duration_ms"))
+    columns = validate.load_columns(csv_path, ("result", "moves", "duration_ms"))
+
+    assert table.column_names == ["result", "moves"]
+    assert columns == {"result": ["win"], "moves": [12], "duration_ms": [None]}
+
+
+def test_csv_column_loads_without_requested_columns_skip_the_parse(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    csv_path = tmp_path / "unrelated.csv"
+    csv_path.write_text(
+        'tag,a,b\npi,1,2\n\nrho,3,"multi\nline"\n',
+        encoding="utf-8",
+    )
+
+    table = validate._read_csv_table(csv_path, ("result",))
+    columns = validate.load_columns(csv_path, ("result", "moves"))
+
+    assert table.column_names == []
+    assert table.num_rows == 2
+    assert columns == {"result": ["", ""], "moves": [None, None]}
+
+
+def test_main_with_jobs_matches_sequential_output(tmp_path, capsys):
+    paths = []
+    for index, result in enumerate(("win", "loss", "bogus")):
+        csv_path = tmp_path / f"sample-{index}.csv"
+        csv_path.write_text(
+            "tag,result,timestamp_utc\n"
+            f"hand-1,{result},2023-01-01T00:00:00Z\n"
+            "hand-2,loss,2023-01-02T00:00:00Z\n",
+            encoding="utf-8",
+        )
+        paths.append(str(csv_path))
+
+    assert validate.main(paths) == 1
+    sequential = capsys.readouterr().out
+
+    assert validate.main(["--jobs", "2", *paths]) == 1
+    assert capsys.readouterr().out == sequential
+    assert "Unexpected result values: bogus" in sequential